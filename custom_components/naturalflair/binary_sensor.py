@@ -126,7 +126,9 @@ class Connectivity(CoordinatorEntity, BinarySensorEntity):
             current_dt = datetime.now()
             if not self.last_logged:
                 LOGGER.warning(
-                    f'Flair {TYPE_TO_MODEL[self.device_type]}: {self.device_data.attributes["name"]} is reported to be offline.'
+                    'Flair %s: %s is reported to be offline.',
+                    TYPE_TO_MODEL[self.device_type],
+                    self.device_data.attributes["name"],
                 )
                 self.last_logged = current_dt
                 self.next_log = current_dt + timedelta(seconds=300)
@@ -134,7 +136,9 @@ class Connectivity(CoordinatorEntity, BinarySensorEntity):
                 # If 5 minutes has elapsed since the last log, log the device being offline.
                 if (self.next_log - current_dt).total_seconds() <= 0:
                     LOGGER.warning(
-                        f'Flair {TYPE_TO_MODEL[self.device_type]}: {self.device_data.attributes["name"]} is reported to be offline.'
+                        'Flair %s: %s is reported to be offline.',
+                        TYPE_TO_MODEL[self.device_type],
+                        self.device_data.attributes["name"],
                     )
                     self.last_logged = current_dt
                     self.next_log = current_dt + timedelta(seconds=300)
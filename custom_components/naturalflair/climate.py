@@ -1,6 +1,9 @@
 """Climate platform for Flair integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+from types import MappingProxyType
 from typing import Any
 
 from flairaio.exceptions import FlairError
@@ -26,9 +29,9 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback, EntityPlatform
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -44,12 +47,61 @@ from .const import (
     ROOM_HVAC_MAP,                    # e.g. {"heat": HVACMode.HEAT, "float": HVACMode.OFF, ...}
 )
 from .coordinator import FlairDataUpdateCoordinator
+from .entity import FlairCoordinatorEntity
+from .util import mirror_attributes
 
 # Reverse maps for converting from HA -> Flair
-ROOM_HVAC_MAP_TO_FLAIR = {v: k for (k, v) in ROOM_HVAC_MAP.items()}
-HASS_HVAC_MODE_TO_FLAIR = {v: k for (k, v) in HVAC_CURRENT_MODE_MAP.items()}
-HASS_HVAC_FAN_SPEED_TO_FLAIR = {v: k for (k, v) in HVAC_CURRENT_FAN_SPEED.items()}
-HASS_HVAC_SWING_TO_FLAIR = {v: k for (k, v) in HVAC_SWING_STATE.items()}
+ROOM_HVAC_MAP_TO_FLAIR = MappingProxyType(dict(zip(ROOM_HVAC_MAP.values(), ROOM_HVAC_MAP.keys())))
+HASS_HVAC_MODE_TO_FLAIR = MappingProxyType(dict(zip(HVAC_CURRENT_MODE_MAP.values(), HVAC_CURRENT_MODE_MAP.keys())))
+HASS_HVAC_FAN_SPEED_TO_FLAIR = MappingProxyType(dict(zip(HVAC_CURRENT_FAN_SPEED.values(), HVAC_CURRENT_FAN_SPEED.keys())))
+HASS_HVAC_SWING_TO_FLAIR = MappingProxyType(dict(zip(HVAC_SWING_STATE.values(), HVAC_SWING_STATE.keys())))
+
+# Auto structure mode writes default-fan-speed in all capital letters and swing-auto as a
+# boolean, while fan-speed and swing keep Flair's title-case values; map both at once.
+HASS_HVAC_FAN_SPEED_TO_FLAIR_AUTO = MappingProxyType({
+    hass_speed: (flair_speed.upper(), flair_speed)
+    for (hass_speed, flair_speed) in HASS_HVAC_FAN_SPEED_TO_FLAIR.items()
+})
+HASS_HVAC_SWING_TO_FLAIR_AUTO = MappingProxyType({
+    hass_swing: (flair_swing == "On", flair_swing)
+    for (hass_swing, flair_swing) in HASS_HVAC_SWING_TO_FLAIR.items()
+})
+
+# Prebuilt request payloads for fixed-value writes, shared by every entity.
+STRUCTURE_MODE_PAYLOADS = MappingProxyType({
+    hass_mode: {"structure-heat-cool-mode": flair_mode}
+    for (hass_mode, flair_mode) in ROOM_HVAC_MAP_TO_FLAIR.items()
+})
+ROOM_ACTIVE_PAYLOAD = {"active": True}
+ROOM_INACTIVE_PAYLOAD = {"active": False}
+
+# Celsius <-> Fahrenheit scale factors, folded into a single multiply.
+C_TO_F_FACTOR = 1.8
+F_TO_C_FACTOR = 5 / 9
+
+# Fixed mode lists and feature flags for the structure, room and HVAC entities.
+STRUCTURE_HVAC_MODES = (HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.HEAT_COOL)
+ROOM_HVAC_MODES = (HVACMode.OFF, HVACMode.AUTO)
+HVAC_HVAC_MODES = tuple(HASS_HVAC_MODE_TO_FLAIR)
+HVAC_FAN_MODES = tuple(HVAC_AVAILABLE_FAN_SPEEDS.values())
+HVAC_SWING_MODES = (SWING_OFF, SWING_ON)
+STRUCTURE_SUPPORTED_FEATURES = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_OFF
+ROOM_SUPPORTED_FEATURES = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_OFF
+# HVAC modes in which an IR unit has no target temperature.
+HVAC_NO_TEMPERATURE_MODES = frozenset((HVACMode.OFF, HVACMode.FAN_ONLY, HVACMode.DRY))
+
+# Flair attribute written by HVAC.set_attributes, keyed by (auto structure mode, setting).
+HVAC_ATTRIBUTE_KEYS = MappingProxyType({
+    (True, 'temp'): "set-point-c",
+    (True, 'fan_mode'): "default-fan-speed",
+    (True, 'swing_mode'): "swing-auto",
+    (False, 'temp'): "temperature",
+    (False, 'fan_mode'): "fan-speed",
+    (False, 'swing_mode'): "swing",
+})
+
+# Structure set-point-mode in which the thermostat, not Flair, owns the set point.
+SET_POINT_FOLLOW_THIRD_PARTY = "Home Evenness For Active Rooms Follow Third Party"
 
 
 async def async_setup_entry(
@@ -61,341 +113,303 @@ async def async_setup_entry(
 
     coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    climates = []
+    async_add_entities(_iter_climate_entities(coordinator))
+
+
+def _iter_climate_entities(
+    coordinator: FlairDataUpdateCoordinator,
+) -> Iterator[ClimateEntity]:
+    """Yield every climate entity for the structures known to the coordinator."""
 
     # Loop through each structure
     for structure_id, structure_data in coordinator.data.structures.items():
         # Add a StructureClimate (like a central thermostat)
-        climates.append(StructureClimate(coordinator, structure_id))
+        yield StructureClimate(coordinator, structure_id)
 
         # Add a RoomTemp entity for each room
-        if structure_data.rooms:
-            for room_id in structure_data.rooms:
-                climates.append(RoomTemp(coordinator, structure_id, room_id))
+        for room_id in structure_data.rooms or {}:
+            yield RoomTemp(coordinator, structure_id, room_id)
 
         # Add an HVAC entity for each advanced IR mini-split / HVAC unit
-        if structure_data.hvac_units:
-            for hvac_id, hvac_data in structure_data.hvac_units.items():
-                constraints = hvac_data.attributes["constraints"]
-                if isinstance(constraints, dict):  # means it's a more advanced IR device
-                    codesets = hvac_data.attributes["codesets"][0]
-                    if (
-                        "temperature-scale" not in constraints
-                        and "temperature-scale" not in codesets
-                    ):
-                        unit_name = hvac_data.attributes["name"]
-                        LOGGER.error(
-                            f"Flair HVAC Unit {unit_name} does not have a temperature scale. "
-                            "Contact Flair support to get this fixed."
-                        )
-                    else:
-                        climates.append(HVAC(coordinator, structure_id, hvac_id))
-
-    async_add_entities(climates)
-
-
-class StructureClimate(CoordinatorEntity, ClimateEntity):
+        for hvac_id, hvac_data in (structure_data.hvac_units or {}).items():
+            scale = _hvac_temperature_scale(hvac_data)
+            if scale is not None:
+                yield HVAC(coordinator, structure_id, hvac_id, hvac_data, scale)
+
+
+def _hvac_temperature_scale(hvac_data: HVACUnit) -> str | None:
+    """Return the temperature scale of a supported HVAC unit, or None if it can't be set up."""
+    attrs = hvac_data.attributes
+    constraints = attrs["constraints"]
+    if not isinstance(constraints, dict):  # only advanced IR devices have dict constraints
+        return None
+    if _relationship_id(hvac_data, "puck") is None or _relationship_id(hvac_data, "room") is None:
+        LOGGER.warning(
+            "Flair HVAC Unit %s is not linked to a puck and room. Skipping it.",
+            attrs["name"],
+        )
+        return None
+    scale = constraints.get("temperature-scale")
+    if scale is None:
+        scale = (attrs.get("codesets") or [{}])[0].get("temperature-scale")
+    if scale is None:
+        LOGGER.error(
+            "Flair HVAC Unit %s does not have a temperature scale. "
+            "Contact Flair support to get this fixed.",
+            attrs["name"],
+        )
+    return scale
+
+
+def _relationship_id(hvac_data: HVACUnit, name: str) -> str | None:
+    """Return the id of a related resource, or None if the relationship is missing."""
+    return ((hvac_data.relationships.get(name) or {}).get("data") or {}).get("id")
+
+
+class StructureClimate(FlairCoordinatorEntity, ClimateEntity):
     """Representation of Structure-wide HVAC (like a central thermostat)."""
 
+    # Only this entity's own fields; _attr_* values stay in the instance dict.
+    __slots__ = ("structure_id", "_structure")
+
     _enable_turn_on_off_backwards_compatibility = False
+    _attr_has_entity_name = True
+    _attr_name = "Structure"
+    _attr_icon = "mdi:home-thermometer"
+    # Off, Heat, Cool, Heat/Cool at the structure level.
+    _attr_hvac_modes = list(STRUCTURE_HVAC_MODES)
+    _attr_supported_features = STRUCTURE_SUPPORTED_FEATURES
 
     def __init__(self, coordinator, structure_id):
         super().__init__(coordinator)
         self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes["name"],
+        self._resolve_data()
+        structure_data = self.structure_data
+        self._attr_unique_id = str(structure_data.id)
+        # Disable if structure is in 'manual' mode.
+        self._attr_entity_registry_enabled_default = structure_data.attributes["mode"] != "manual"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, structure_data.id)},
+            "name": structure_data.attributes["name"],
             "manufacturer": "Flair",
             "model": "Structure",
             "configuration_url": "https://my.flair.co/",
         }
 
-    @property
-    def unique_id(self) -> str:
-        return str(self.structure_data.id)
-
-    @property
-    def name(self) -> str:
-        return "Structure"
-
-    @property
-    def has_entity_name(self) -> bool:
-        return True
-
-    @property
-    def icon(self) -> str:
-        return "mdi:home-thermometer"
-
-    @property
-    def temperature_unit(self) -> UnitOfTemperature:
-        """Convert celsius/fahrenheit based on HA's system settings."""
-        return (
-            UnitOfTemperature.CELSIUS
-            if self.hass.config.units is METRIC_SYSTEM
-            else UnitOfTemperature.FAHRENHEIT
-        )
-
-    @property
-    def target_temperature(self) -> float:
-        """Return the structure set point, converting if necessary."""
-        c_value = self.structure_data.attributes["set-point-temperature-c"]
-        if self.hass.config.units is METRIC_SYSTEM:
-            return c_value
-        return round((c_value * 9 / 5) + 32)
-
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        """Map structure-heat-cool-mode to an HA HVACMode."""
-        flair_mode = self.structure_data.attributes["structure-heat-cool-mode"]
-        return ROOM_HVAC_MAP.get(flair_mode, HVACMode.OFF)
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Off, Heat, Cool, Heat/Cool at the structure level."""
-        return [HVACMode.OFF, HVACMode.COOL, HVACMode.HEAT, HVACMode.HEAT_COOL]
-
-    @property
-    def supported_features(self) -> int:
-        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_OFF
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable if structure is in 'manual' mode."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Show as unavailable if 'manual' system mode."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def target_temperature_low(self) -> float:
-        """Return minimum allowed set point in celsius or fahrenheit."""
+    def _resolve_data(self) -> None:
+        """Look up this entity's structure and derive its state once per coordinator update."""
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        attributes = self._structure.attributes
+        # Show as unavailable if 'manual' system mode.
+        self._attr_available = attributes["mode"] != "manual"
+        self._attr_hvac_mode = ROOM_HVAC_MAP.get(attributes["structure-heat-cool-mode"], HVACMode.OFF)
+
+    async def _async_queue_attributes(self, attributes: dict[str, Any]) -> None:
+        """Apply attributes locally and queue them for the coordinator's merged write."""
+        if mirror_attributes(self.structure_data.attributes, attributes):
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_queue_update('structures', self.structure_data.id, attributes)
+
+    def _resolve_temperatures(self) -> None:
+        """Derive the unit, set point and set point limits from HA's unit system."""
+        c_value = self._structure.attributes["set-point-temperature-c"]
         if self.hass.config.units is METRIC_SYSTEM:
-            return 10.0
+            self._attr_temperature_unit = UnitOfTemperature.CELSIUS
+            self._attr_target_temperature = c_value
+            self._attr_target_temperature_low = 10.0
+            self._attr_target_temperature_high = 32.23
+            self._attr_target_temperature_step = 0.5
         else:
-            return 50.0
+            self._attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+            self._attr_target_temperature = round(c_value * C_TO_F_FACTOR + 32)
+            self._attr_target_temperature_low = 50.0
+            self._attr_target_temperature_high = 90.0
+            self._attr_target_temperature_step = 1.0
+
+    @callback
+    def add_to_platform_start(
+        self,
+        hass: HomeAssistant,
+        platform: EntityPlatform,
+        parallel_updates: asyncio.Semaphore | None,
+    ) -> None:
+        """Derive the temperatures as soon as hass, and so its unit system, is bound.
+
+        The platform reads the unit-dependent limits while registering the entity,
+        before async_added_to_hass runs.
+        """
+        super().add_to_platform_start(hass, platform, parallel_updates)
+        self._resolve_temperatures()
 
-    @property
-    def target_temperature_high(self) -> float:
-        """Return maximum allowed set point in celsius or fahrenheit."""
-        if self.hass.config.units is METRIC_SYSTEM:
-            return 32.23
-        else:
-            return 90.0
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._resolve_data()
+        self._resolve_temperatures()
+        super()._handle_coordinator_update()
 
     @property
-    def target_temperature_step(self) -> float:
-        """Return temp stepping by 0.5 celsius or 1 fahrenheit."""
-        if self.hass.config.units is METRIC_SYSTEM:
-            return 0.5
-        else:
-            return 1.0
+    def structure_data(self) -> Structure:
+        return self._structure
 
     async def async_turn_off(self) -> None:
         """Set structure mode to off."""
-        attributes = self.set_attributes('float', 'hvac_mode')
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = 'float'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        attributes = STRUCTURE_MODE_PAYLOADS[HVACMode.OFF]
+        if self.structure_data.attributes.get("structure-heat-cool-mode") == attributes["structure-heat-cool-mode"]:
+            return
+        await self._async_queue_attributes(attributes)
 
     async def async_set_hvac_mode(self, hvac_mode) -> None:
-        flair_mode = ROOM_HVAC_MAP_TO_FLAIR.get(hvac_mode)
-        if flair_mode is None:
-            LOGGER.error(f"StructureClimate: Unsupported hvac_mode '{hvac_mode}' (no Flair mapping). Not sending update.")
+        try:
+            attributes = STRUCTURE_MODE_PAYLOADS[hvac_mode]
+        except KeyError:
+            LOGGER.error("StructureClimate: Unsupported hvac_mode '%s' (no Flair mapping). Not sending update.", hvac_mode)
+            return
+        if self.structure_data.attributes.get("structure-heat-cool-mode") == attributes["structure-heat-cool-mode"]:
             return
-        attributes = self.set_attributes(flair_mode, 'hvac_mode')
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = flair_mode
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        await self._async_queue_attributes(attributes)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
-        current_controller = self.structure_data.attributes['set-point-mode']
-        if current_controller == "Home Evenness For Active Rooms Follow Third Party":
-            LOGGER.error(f'Target temperature for Structure {self.structure_data.attributes["name"]} can only be set when the "Set point controller" is Flair app')
-        else:
-            if self.hass.config.units is METRIC_SYSTEM:
-                temp = kwargs.get(ATTR_TEMPERATURE)
-            else:
-                temp = round(((kwargs.get(ATTR_TEMPERATURE) - 32) * (5/9)), 2)
-            attributes = self.set_attributes(temp, 'temperature')
-            await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-            self.structure_data.attributes['set-point-temperature-c'] = temp
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+        if self.structure_data.attributes['set-point-mode'] == SET_POINT_FOLLOW_THIRD_PARTY:
+            LOGGER.error('Target temperature for Structure %s can only be set when the "Set point controller" is Flair app', self.structure_data.attributes["name"])
+            return
+        temp = kwargs.get(ATTR_TEMPERATURE)
+        if self._attr_temperature_unit is UnitOfTemperature.FAHRENHEIT:
+            temp = round((temp - 32) * F_TO_C_FACTOR, 2)
+        if self.structure_data.attributes["set-point-temperature-c"] == temp:
+            return
+        attributes = self.set_attributes(temp)
+        await self._async_queue_attributes(attributes)
 
     @staticmethod
-    def set_attributes(value: float | str, mode: str) -> dict[str, Any]:
+    def set_attributes(value: float) -> dict[str, Any]:
         """Creates attribute dict that is needed by the flairaio update method."""
-        if mode == 'temperature':
-            attributes = {
-                'set-point-temperature-c': value
-            }
-        else:
-            attributes = {
-                'structure-heat-cool-mode': value,
-            }
+        attributes = {
+            'set-point-temperature-c': value
+        }
         return attributes
 
 
-class RoomTemp(CoordinatorEntity, ClimateEntity):
+class RoomTemp(FlairCoordinatorEntity, ClimateEntity):
     """Representation of a single Flair Room as a climate entity."""
 
+    __slots__ = ("structure_id", "room_id", "_structure", "_room")
+
     _enable_turn_on_off_backwards_compatibility = False
+    # False so it doesn't append anything to the name.
+    _attr_has_entity_name = False
+    # Use a door icon to represent a room.
+    _attr_icon = "mdi:door-open"
+    # Flair room temps are always in celsius natively.
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    # Limit this room entity to OFF and AUTO only.
+    # - OFF => Mark the room inactive
+    # - AUTO => Mark the room active and follow the structure's actual mode
+    _attr_hvac_modes = list(ROOM_HVAC_MODES)
+    # Target temp can still be set, but the only hvac_modes are OFF or AUTO.
+    _attr_supported_features = ROOM_SUPPORTED_FEATURES
 
     def __init__(self, coordinator, structure_id, room_id):
         super().__init__(coordinator)
         self.structure_id = structure_id
         self.room_id = room_id
-
-    @property
-    def room_data(self) -> Room:
-        return self.coordinator.data.structures[self.structure_id].rooms[self.room_id]
-
-    @property
-    def structure_data(self) -> Structure:
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.room_data.id)},
-            "name": self.room_data.attributes["name"],
+        self._resolve_data()
+        room_data = self.room_data
+        self._attr_unique_id = str(room_data.id)
+        self._attr_name = room_data.attributes["name"]
+        # If the system is manual, we don't enable by default.
+        self._attr_entity_registry_enabled_default = self.structure_data.attributes["mode"] != "manual"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, room_data.id)},
+            "name": room_data.attributes["name"],
             "manufacturer": "Flair",
             "model": "Room",
             "configuration_url": "https://my.flair.co/",
         }
 
-    @property
-    def unique_id(self) -> str:
-        return str(self.room_data.id)
-
-    @property
-    def name(self) -> str:
-        return self.room_data.attributes["name"]
-
-    @property
-    def has_entity_name(self) -> bool:
-        """False so it doesn't append anything to the name."""
-        return False
-
-    @property
-    def icon(self) -> str:
-        """Use a door icon to represent a room."""
-        return "mdi:door-open"
-
-    @property
-    def temperature_unit(self) -> UnitOfTemperature:
-        """Flair room temps are always in celsius natively."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """
-        Limit this room entity to OFF and AUTO only.
-        - OFF => Mark the room inactive
-        - AUTO => Mark the room active and follow the structure's actual mode
-        """
-        return [HVACMode.OFF, HVACMode.AUTO]
-
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return OFF if the room is inactive, else AUTO."""
-        if not self.room_data.attributes.get("active", True):
-            return HVACMode.OFF
-        return HVACMode.AUTO
-
-    @property
-    def current_temperature(self) -> float:
-        return self.room_data.attributes.get("current-temperature-c") or 0.0
-
-    @property
-    def target_temperature(self) -> float:
-        return self.room_data.attributes.get("set-point-c") or 0.0
-
-    @property
-    def current_humidity(self) -> int:
-        return self.room_data.attributes.get("current-humidity") or 0
-
-    @property
-    def supported_features(self) -> int:
-        """
-        We'll let them set target temp as well, if desired, but
-        the only official 'hvac_modes' are OFF or AUTO here.
-        """
-        return ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.TURN_OFF
+    def _resolve_data(self) -> None:
+        """Look up this entity's structure and room and derive its state once per coordinator update."""
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        room = (self._structure.rooms or {}).get(self.room_id)
+        if room is None:
+            # The room is gone from the structure; keep its last state but show unavailable.
+            self._attr_available = False
+            return
+        self._room = room
+        attributes = room.attributes
+        temp = attributes.get("current-temperature-c")
+        # If the system is manual, or there's no current temp reading, show unavailable.
+        self._attr_available = self._structure.attributes["mode"] != "manual" and temp is not None
+        # OFF if the room is inactive, else AUTO.
+        self._attr_hvac_mode = HVACMode.AUTO if attributes.get("active", True) else HVACMode.OFF
+        self._attr_current_temperature = temp if temp is not None else 0.0
+        set_point = attributes.get("set-point-c")
+        self._attr_target_temperature = set_point if set_point is not None else 0.0
+        humidity = attributes.get("current-humidity")
+        self._attr_current_humidity = humidity if humidity is not None else 0
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._resolve_data()
+        super()._handle_coordinator_update()
 
     @property
-    def entity_registry_enabled_default(self) -> bool:
-        """If the system is manual, we don't enable by default."""
-        return self.structure_data.attributes["mode"] != "manual"
+    def room_data(self) -> Room:
+        return self._room
 
     @property
-    def available(self) -> bool:
-        """If the system is manual, or there's no current temp reading, show unavailable."""
-        if self.structure_data.attributes["mode"] == "manual":
-            return False
-        return self.room_data.attributes.get("current-temperature-c") is not None
+    def structure_data(self) -> Structure:
+        return self._structure
 
     async def async_turn_off(self) -> None:
         """Set structure mode to off."""
-        attributes = self.set_attributes('float', 'hvac_mode')
-        await self.coordinator.client.update('structures', self.structure_data.id, attributes=attributes, relationships={})
-        self.structure_data.attributes['structure-heat-cool-mode'] = 'float'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        attributes = STRUCTURE_MODE_PAYLOADS[HVACMode.OFF]
+        if self.structure_data.attributes.get("structure-heat-cool-mode") == attributes["structure-heat-cool-mode"]:
+            return
+        if mirror_attributes(self.structure_data.attributes, attributes):
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_queue_update('structures', self.structure_data.id, attributes)
 
     async def async_set_hvac_mode(self, hvac_mode) -> None:
         if hvac_mode == HVACMode.OFF:
-            data = {"active": False}
-            await self.coordinator.client.update("rooms", self.room_data.id, data, relationships={})
-            self.room_data.attributes["active"] = False
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            if not self.room_data.attributes.get("active", True):
+                return
+            if mirror_attributes(self.room_data.attributes, ROOM_INACTIVE_PAYLOAD):
+                self.coordinator.async_update_listeners()
+            await self.coordinator.async_queue_update("rooms", self.room_data.id, ROOM_INACTIVE_PAYLOAD)
         elif hvac_mode == HVACMode.AUTO:
             # Mark room as active, but do not change structure mode
             if not self.room_data.attributes.get("active", True):
-                await self.coordinator.client.update("rooms", self.room_data.id, {"active": True}, relationships={})
-                self.room_data.attributes["active"] = True
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+                if mirror_attributes(self.room_data.attributes, ROOM_ACTIVE_PAYLOAD):
+                    self.coordinator.async_update_listeners()
+                await self.coordinator.async_queue_update("rooms", self.room_data.id, ROOM_ACTIVE_PAYLOAD)
         else:
-            LOGGER.warning(f"RoomTemp: Unsupported hvac_mode '{hvac_mode}' attempted. Only 'off' and 'auto' are allowed for room entities.")
+            LOGGER.warning("RoomTemp: Unsupported hvac_mode '%s' attempted. Only 'off' and 'auto' are allowed for room entities.", hvac_mode)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         temp = kwargs.get(ATTR_TEMPERATURE)
-        attributes = self.set_attributes(temp, 'temperature')
         if temp is not None:
-            await self.coordinator.client.update('rooms', self.room_data.id, attributes=attributes, relationships={})
-            self.room_data.attributes['set-point-c'] = temp
-            self.async_write_ha_state()
-            return await self.coordinator.async_request_refresh()
+            room_attributes = self.room_data.attributes
+            attributes = self.set_attributes(temp)
+            if room_attributes.get("active", True):
+                if room_attributes.get("set-point-c") == temp:
+                    return
+            else:
+                # Only send the active flag when the room actually needs activating.
+                attributes['active'] = True
+            if mirror_attributes(room_attributes, attributes):
+                self.coordinator.async_update_listeners()
+            await self.coordinator.async_queue_update('rooms', self.room_data.id, attributes)
         else:
-            LOGGER.error(f'Missing valid arguments for set_temperature in {kwargs}')
+            LOGGER.error('Missing valid arguments for set_temperature in %s', kwargs)
 
     @staticmethod
-    def set_attributes(value: float | str, mode: str) -> dict[str, Any]:
+    def set_attributes(value: float) -> dict[str, Any]:
         """Creates attribute dict that is needed by the flairaio update method."""
-        if mode == 'temperature':
-            attributes = {
-                'set-point-c': value,
-                'active': True,
-            }
-        else:
-            attributes = {
-                'structure-heat-cool-mode': value,
-            }
+        attributes = {
+            'set-point-c': value,
+        }
         return attributes
 
 
@@ -406,169 +420,145 @@ class HVAC(CoordinatorEntity, ClimateEntity):
     individually. 
     """
 
-    _enable_turn_on_off_backwards_compatibility = False
+    __slots__ = ("structure_id", "hvac_id", "_structure", "_hvac", "_room", "_puck_id", "_room_id")
 
-    def __init__(self, coordinator, structure_id, hvac_id):
+    _enable_turn_on_off_backwards_compatibility = False
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:hvac"
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_OFF
+        | ClimateEntityFeature.FAN_MODE
+        | ClimateEntityFeature.SWING_MODE
+    )
+    _attr_hvac_modes = list(HVAC_HVAC_MODES)
+    _attr_fan_modes = list(HVAC_FAN_MODES)
+    _attr_swing_modes = list(HVAC_SWING_MODES)
+
+    def __init__(self, coordinator, structure_id, hvac_id, hvac_data, temperature_scale):
         super().__init__(coordinator)
         self.structure_id = structure_id
         self.hvac_id = hvac_id
-
-    @property
-    def hvac_data(self) -> HVACUnit:
-        return self.coordinator.data.structures[self.structure_id].hvac_units[self.hvac_id]
-
-    @property
-    def structure_data(self) -> Structure:
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def puck_data(self) -> Puck:
-        """For diagnostic availability, etc."""
-        puck_id = self.hvac_data.relationships["puck"]["data"]["id"]
-        return self.structure_data.pucks[puck_id]
-
-    @property
-    def room_data(self) -> Room:
-        """Return the room object to which this HVAC is tied."""
-        room_id = self.hvac_data.relationships["room"]["data"]["id"]
-        return self.structure_data.rooms[room_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        return {
-            "identifiers": {(DOMAIN, self.hvac_data.id)},
-            "name": self.hvac_data.attributes["name"],
-            "manufacturer": self.hvac_data.attributes["make-name"],
+        self._attr_unique_id = str(hvac_data.id)
+        self._attr_name = hvac_data.attributes["name"]
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, hvac_data.id)},
+            "name": hvac_data.attributes["name"],
+            "manufacturer": hvac_data.attributes["make-name"],
             "model": "HVAC Unit",
             "configuration_url": "https://my.flair.co/",
         }
 
-    @property
-    def unique_id(self) -> str:
-        return str(self.hvac_data.id)
-
-    @property
-    def name(self) -> str:
-        return self.hvac_data.attributes["name"]
-
-    @property
-    def has_entity_name(self) -> bool:
-        return True
-
-    @property
-    def icon(self) -> str:
-        return "mdi:hvac"
+        # The puck and room an IR device is attached to don't change.
+        self._puck_id = _relationship_id(hvac_data, "puck")
+        self._room_id = _relationship_id(hvac_data, "room")
 
-    @property
-    def temperature_unit(self) -> UnitOfTemperature:
-        constraints = self.hvac_data.attributes["constraints"]
-        if "temperature-scale" in constraints:
-            scale = constraints["temperature-scale"]
-        else:
-            scale = self.hvac_data.attributes["codesets"][0]["temperature-scale"]
-
-        return (
+        # The IR device's temperature scale is fixed when it is provisioned.
+        self._attr_temperature_unit = (
             UnitOfTemperature.FAHRENHEIT
-            if scale == "F"
+            if temperature_scale == "F"
             else UnitOfTemperature.CELSIUS
         )
+        self._resolve_data()
+
+    def _resolve_data(self) -> None:
+        """Look up this entity's structure, HVAC unit and room and derive its state once per coordinator update."""
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        self._hvac = self._structure.hvac_units[self.hvac_id]
+        # The room the unit points at can be missing from the structure; see available.
+        self._room = (self._structure.rooms or {}).get(self._room_id)
+        attributes = self._hvac.attributes
+        flair_mode = attributes.get("mode", "Off")
+        self._attr_hvac_mode = HVAC_AVAILABLE_MODES_MAP.get(flair_mode, HVACMode.OFF)
+        self._attr_hvac_action = (
+            HVAC_CURRENT_ACTION.get(flair_mode, HVACAction.IDLE)
+            if attributes.get("power") == "On"
+            else HVACAction.OFF
+        )
+        self._attr_fan_mode = HVAC_CURRENT_FAN_SPEED.get(attributes.get("fan-speed"), FAN_AUTO)
+        self._attr_swing_mode = HVAC_SWING_STATE.get(attributes.get("swing"), SWING_OFF)
+        self._attr_target_temperature = attributes.get("temperature")
+        self._attr_current_temperature = (
+            self._room.attributes.get("current-temperature-c", 0.0)
+            if self._room is not None
+            else None
+        )
 
-    @property
-    def is_on(self) -> bool:
-        """If Flair says 'power': 'On', then it's on."""
-        return self.hvac_data.attributes.get("power") == "On"
-
-    @property
-    def hvac_mode(self) -> HVACMode | None:
-        flair_mode = self.hvac_data.attributes.get("mode", "Off")
-        return HVAC_AVAILABLE_MODES_MAP.get(flair_mode, HVACMode.OFF)
-
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        return list(HASS_HVAC_MODE_TO_FLAIR.keys())
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._resolve_data()
+        super()._handle_coordinator_update()
 
     @property
-    def fan_mode(self) -> str | None:
-        flair_fan = self.hvac_data.attributes.get("fan-speed")
-        if flair_fan in HVAC_CURRENT_FAN_SPEED:
-            return HVAC_CURRENT_FAN_SPEED[flair_fan]
-        return FAN_AUTO  # fallback if unknown
-
-    @property
-    def fan_modes(self) -> list[str]:
-        return list(HVAC_AVAILABLE_FAN_SPEEDS.values())
+    def hvac_data(self) -> HVACUnit:
+        return self._hvac
 
     @property
-    def swing_mode(self) -> str | None:
-        flair_swing = self.hvac_data.attributes.get("swing")
-        if flair_swing in HVAC_SWING_STATE:
-            return HVAC_SWING_STATE[flair_swing]
-        return SWING_OFF  # default if unknown
+    def structure_data(self) -> Structure:
+        return self._structure
 
     @property
-    def swing_modes(self) -> list[str]:
-        return [SWING_OFF, SWING_ON]
+    def structure_mode(self) -> str:
+        """Return the structure's system mode ('auto' or 'manual')."""
+        return self._structure.attributes["mode"]
 
     @property
-    def current_temperature(self) -> float | None:
-        return self.room_data.attributes.get("current-temperature-c", 0.0)
+    def puck_data(self) -> Puck:
+        """For diagnostic availability, etc."""
+        return self.structure_data.pucks[self._puck_id]
 
     @property
-    def target_temperature(self) -> float | None:
-        current_set = self.hvac_data.attributes.get("temperature")
-        if current_set is None:
-            return None
-        return current_set
+    def room_data(self) -> Room | None:
+        """Return the room object to which this HVAC is tied, or None if it is missing."""
+        return self._room
 
     @property
-    def hvac_action(self) -> HVACAction | None:
-        if not self.is_on:
-            return HVACAction.OFF
-
-        flair_mode = self.hvac_data.attributes.get("mode", "Off")
-        return HVAC_CURRENT_ACTION.get(flair_mode, HVACAction.IDLE)
+    def available(self) -> bool:
+        """Return false while the HVAC unit's room is missing from the structure."""
+        return super().available and self._room is not None
 
     @property
-    def supported_features(self) -> int:
-        return (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TURN_OFF
-            | ClimateEntityFeature.FAN_MODE
-            | ClimateEntityFeature.SWING_MODE
-        )
+    def is_on(self) -> bool:
+        """If Flair says 'power': 'On', then it's on."""
+        return self.hvac_data.attributes.get("power") == "On"
 
     async def async_turn_off(self) -> None:
         """Turn IR HVAC unit off."""
+        if self.hvac_data.attributes.get("power") == "Off":
+            return
         power_attributes = {"power": "Off"}
-        await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=power_attributes, relationships={})
-        self.hvac_data.attributes['power'] = 'Off'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        if mirror_attributes(self.hvac_data.attributes, power_attributes):
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_queue_update('hvac-units', self.hvac_data.id, power_attributes)
 
     async def async_turn_on(self) -> None:
         """Turn IR HVAC unit on."""
-        mode = self.hvac_data.attributes['mode']
+        if self.is_on:
+            return
         power_attributes = {"power": "On"}
-        await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=power_attributes, relationships={})
-        self.hvac_data.attributes['power'] = 'On'
-        self.async_write_ha_state()
-        return await self.coordinator.async_request_refresh()
+        if mirror_attributes(self.hvac_data.attributes, power_attributes):
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_queue_update('hvac-units', self.hvac_data.id, power_attributes)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
+        hvac_data = self.hvac_data
+        hvac_attributes = hvac_data.attributes
         if ATTR_HVAC_MODE in kwargs:
             hvac_mode = kwargs[ATTR_HVAC_MODE]
-            if hvac_mode in [HVACMode.OFF, HVACMode.FAN_ONLY, HVACMode.DRY]:
-                raise FlairError(f'{self.hvac_data.attributes["name"]}: Setting temperature is not supported for {hvac_mode} mode')
+            if hvac_mode in HVAC_NO_TEMPERATURE_MODES:
+                raise FlairError(f'{hvac_attributes["name"]}: Setting temperature is not supported for {hvac_mode} mode')
             else:
                 await self.async_set_hvac_mode(hvac_mode)
 
         temp = kwargs.get(ATTR_TEMPERATURE)
+        structure_mode = self.structure_mode
 
         # Get room ID if in auto mode or HVAC ID if in manual mode.
-        if self.structure_mode == 'auto':
+        if structure_mode == 'auto':
             auto_mode = True
-            type_id = self.room_data.id
+            room_data = self.room_data
+            type_id = room_data.id
             type = 'rooms'
 
             if not self.temperature_unit is UnitOfTemperature.CELSIUS:
@@ -576,126 +566,103 @@ class HVAC(CoordinatorEntity, ClimateEntity):
                 # we need to convert the temp to celsius if HVAC unit is not celsius. However, the target temp is read
                 # from the HVAC unit - the temp scale key from the HVAC constraints, used to set the temperature_unit
                 # property, eliminates us from having to do this conversion when setting the HVAC 'temperature' attribute.
-                converted = ((temp - 32) * (5/9))
-                attributes = self.set_attributes('temp', converted, auto_mode)
-                await self.coordinator.client.update(type, type_id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['temperature'] = temp
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                set_point = (temp - 32) * F_TO_C_FACTOR
             else:
-                attributes = self.set_attributes('temp', temp, auto_mode)
-                await self.coordinator.client.update(type, type_id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['temperature'] = temp
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
-
-        if self.structure_mode == 'manual':
+                set_point = temp
+            attributes = self.set_attributes('temp', set_point, auto_mode)
+            # Nothing to send if the room already holds this set point.
+            room_attributes = room_data.attributes
+            if hvac_attributes.get('temperature') == temp and all(
+                room_attributes.get(key) == value for key, value in attributes.items()
+            ):
+                return
+            # The room set point is what gets written; mirror it too since no refresh follows.
+            room_changed = mirror_attributes(room_attributes, attributes)
+            if mirror_attributes(hvac_attributes, {'temperature': temp}) or room_changed:
+                self.coordinator.async_update_listeners()
+            await self.coordinator.async_queue_update(type, type_id, attributes)
+        elif structure_mode == 'manual':
             if not self.is_on:
-                raise HomeAssistantError(f'Temperature for {self.hvac_data.attributes["name"]} can only be set when it is powered on.')
+                raise HomeAssistantError(f'Temperature for {hvac_attributes["name"]} can only be set when it is powered on.')
             else:
+                if hvac_attributes.get('temperature') == temp:
+                    return
                 auto_mode = False
-                type_id = self.hvac_data.id
+                type_id = hvac_data.id
                 type = 'hvac-units'
                 attributes = self.set_attributes('temp', temp, auto_mode)
-                await self.coordinator.client.update(type, type_id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['temperature'] = temp
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                if mirror_attributes(hvac_attributes, {'temperature': temp}):
+                    self.coordinator.async_update_listeners()
+                await self.coordinator.async_queue_update(type, type_id, attributes)
 
     async def async_set_hvac_mode(self, hvac_mode) -> None:
         if hvac_mode == HVACMode.OFF:
             await self.async_turn_off()
         elif hvac_mode == HVACMode.AUTO:
-            # No-op: just mirror structure's mode, do not send to API
-            self.async_write_ha_state()
+            # No-op: the unit already mirrors the structure's mode, so there is nothing to send or write.
+            return
         else:
-            LOGGER.warning(f"HVAC: Unsupported hvac_mode '{hvac_mode}' attempted. Only 'off' and 'auto' are allowed for HVAC entities.")
+            LOGGER.warning("HVAC: Unsupported hvac_mode '%s' attempted. Only 'off' and 'auto' are allowed for HVAC entities.", hvac_mode)
 
     async def async_set_fan_mode(self, fan_mode) -> None:
         """Set new target fan mode."""
-        if self.structure_mode == "auto":
-            mode = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(fan_mode).upper()
+        hvac_data = self.hvac_data
+        hvac_attributes = hvac_data.attributes
+        structure_mode = self.structure_mode
+        if structure_mode == "auto":
+            mode, speed = HASS_HVAC_FAN_SPEED_TO_FLAIR_AUTO[fan_mode]
+            if hvac_attributes.get('default-fan-speed') == mode and hvac_attributes.get('fan-speed') == speed:
+                return
             attributes = self.set_attributes('fan_mode', mode, True)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-            # Key for default-fan-speed uses all capital letters while fan-speed only capitalizes first letter.
-            self.hvac_data.attributes['fan-speed'] = mode.title()
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
-
-        if self.structure_mode == 'manual':
+            if mirror_attributes(hvac_attributes, {**attributes, 'fan-speed': speed}):
+                self.coordinator.async_update_listeners()
+            await self.coordinator.async_queue_update('hvac-units', hvac_data.id, attributes)
+        elif structure_mode == 'manual':
             if self.hvac_mode == HVACMode.DRY:
                 mode = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(FAN_AUTO)
+                if hvac_attributes.get('fan-speed') == mode:
+                    return
                 attributes = self.set_attributes('fan_mode', mode, False)
-                await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['fan-speed'] = mode
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                if mirror_attributes(hvac_attributes, {'fan-speed': mode}):
+                    self.coordinator.async_update_listeners()
+                await self.coordinator.async_queue_update('hvac-units', hvac_data.id, attributes)
             else:
                 mode = HASS_HVAC_FAN_SPEED_TO_FLAIR.get(fan_mode)
+                if hvac_attributes.get('fan-speed') == mode:
+                    return
                 attributes = self.set_attributes('fan_mode', mode, False)
-                await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-                self.hvac_data.attributes['fan-speed'] = mode
-                self.async_write_ha_state()
-                await self.coordinator.async_request_refresh()
+                if mirror_attributes(hvac_attributes, {'fan-speed': mode}):
+                    self.coordinator.async_update_listeners()
+                await self.coordinator.async_queue_update('hvac-units', hvac_data.id, attributes)
 
     async def async_set_swing_mode(self, swing_mode) -> None:
         """Set new target swing operation."""
-        if self.structure_mode == "auto":
+        hvac_data = self.hvac_data
+        hvac_attributes = hvac_data.attributes
+        structure_mode = self.structure_mode
+        if structure_mode == "auto":
             # Auto mode takes True or False for swing mode.
-            mode = HASS_HVAC_SWING_TO_FLAIR.get(swing_mode) == 'On'
+            mode, swing = HASS_HVAC_SWING_TO_FLAIR_AUTO[swing_mode]
+            if hvac_attributes.get('swing-auto') == mode and hvac_attributes.get('swing') == swing:
+                return
             attributes = self.set_attributes('swing_mode', mode, True)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-            # 'swing-auto' key uses boolean while 'swing' uses On and Off.
-            self.hvac_data.attributes['swing'] = HASS_HVAC_SWING_TO_FLAIR.get(swing_mode)
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
-
-        if self.structure_mode == 'manual':
+            if mirror_attributes(hvac_attributes, {**attributes, 'swing': swing}):
+                self.coordinator.async_update_listeners()
+            await self.coordinator.async_queue_update('hvac-units', hvac_data.id, attributes)
+        elif structure_mode == 'manual':
             mode = HASS_HVAC_SWING_TO_FLAIR.get(swing_mode)
+            if hvac_attributes.get('swing') == mode:
+                return
             attributes = self.set_attributes('swing_mode', mode, False)
-            await self.coordinator.client.update('hvac-units', self.hvac_data.id, attributes=attributes, relationships={})
-            self.hvac_data.attributes['swing'] = mode
-            self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
+            if mirror_attributes(hvac_attributes, {'swing': mode}):
+                self.coordinator.async_update_listeners()
+            await self.coordinator.async_queue_update('hvac-units', hvac_data.id, attributes)
 
     @staticmethod
-    def set_attributes(setting: str, value: Any, auto_mode: bool, extra_val: str = None) -> dict[str, Any]:
+    def set_attributes(setting: str, value: Any, auto_mode: bool) -> dict[str, Any]:
         """Create attributes dictionary for client update method."""
-        attributes: dict[str, Any] = {}
-        if auto_mode:
-            if setting == 'temp':
-                attributes = {
-                    "set-point-c": value,
-                    "active": True,
-                }
-            if setting == 'fan_mode':
-                attributes = {
-                    "default-fan-speed": value,
-                }
-            if setting == 'swing_mode':
-                attributes ={
-                    "swing-auto": value,
-                }
-        else:
-            if setting == 'temp':
-                attributes = {
-                    "temperature": value,
-                }
-            if setting == 'hvac_mode':
-                attributes = {
-                    "mode": value,
-                }
-            if setting == 'fan_mode':
-                attributes = {
-                    "fan-speed": value,
-                }
-            if setting == 'swing_mode':
-                attributes ={
-                    "swing": value,
-                }
-            if setting == 'hvac_mode-fan_speed':
-                attributes = {
-                    "mode": value,
-                    "fan-speed": extra_val
-                }
+        attributes = {HVAC_ATTRIBUTE_KEYS[auto_mode, setting]: value}
+        if auto_mode and setting == 'temp':
+            # Setting a room's set point also makes sure the room is active.
+            attributes["active"] = True
         return attributes
@@ -36,6 +36,10 @@ PLATFORMS = [
 
 DEFAULT_NAME = "Flair"
 TIMEOUT = 20
+# Seconds to wait for further writes before sending queued attributes.
+WRITE_COOLDOWN = 0.2
+# Seconds to wait after a requested refresh so Flair reflects the write and bursts coalesce.
+REFRESH_COOLDOWN = 0.3
 
 FLAIR_ERRORS = (
     asyncio.TimeoutError,
@@ -46,10 +50,10 @@ FLAIR_ERRORS = (
 
 # Dictionaries and lists.
 
-AWAY_MODES = [
+AWAY_MODES = (
     "Smart Away",
     "Off Only",
-]
+)
 
 DEFAULT_HOLD_DURATION = {
     "Until": "Until next scheduled event",
@@ -59,10 +63,10 @@ DEFAULT_HOLD_DURATION = {
     "Forever": "Forever",
 }
 
-HOME_AWAY_MODE = [
+HOME_AWAY_MODE = (
     "Home",
     "Away",
-]
+)
 
 HOME_AWAY_SET_BY = {
     "Manual": "Manual",
@@ -114,10 +118,10 @@ HVAC_SWING_STATE = {
     "Off": SWING_OFF,
 }
 
-PUCK_BACKGROUND = [
+PUCK_BACKGROUND = (
     "Black",
     "White",
-]
+)
 
 ROOM_HVAC_MAP = {
     "float": HVACMode.OFF,
@@ -136,10 +140,10 @@ SET_POINT_CONTROLLER = {
     "Home Evenness For Active Rooms Flair Setpoint": "Flair App",
 }
 
-SYSTEM_MODES = [
+SYSTEM_MODES = (
     "Auto",
     "Manual",
-]
+)
 
 TEMPERATURE_SCALES = {
     "F": "Fahrenheit",
@@ -1,22 +1,35 @@
 """DataUpdateCoordinator for the Flair integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import json
+import logging
+from typing import Any
 
 from flairaio import FlairClient
-from flairaio.exceptions import FlairAuthError, FlairError
+from flairaio.exceptions import FlairAuthError
 from flairaio.model import FlairData
 
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER, TIMEOUT
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    FLAIR_ERRORS,
+    LOGGER,
+    REFRESH_COOLDOWN,
+    TIMEOUT,
+    WRITE_COOLDOWN,
+)
 
 
 class FlairDataUpdateCoordinator(DataUpdateCoordinator):
@@ -38,19 +51,101 @@ class FlairDataUpdateCoordinator(DataUpdateCoordinator):
             LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                LOGGER,
+                cooldown=REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
+        # Attributes queued per (resource type, resource id), with the future their callers wait on.
+        self._pending_writes: dict[tuple[str, str], tuple[dict[str, Any], asyncio.Future[None]]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._writes_closed = False
+
+    async def async_queue_update(self, resource_type: str, resource_id: str, attributes: dict[str, Any]) -> None:
+        """Queue attributes for a Flair resource and wait until they have been sent.
+
+        Writes to the same resource within the cooldown are merged into one request,
+        whichever entities made them. Every caller whose attributes went into that
+        request shares its result, so a rejected request raises for each of them.
+        """
+        key = (resource_type, resource_id)
+        if (queued := self._pending_writes.get(key)) is None:
+            queued = self._pending_writes[key] = ({}, self.hass.loop.create_future())
+        queued[0].update(attributes)
+        if self._writes_closed:
+            # No timer may outlive the entry; send straight away instead.
+            await self._async_flush_writes()
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, WRITE_COOLDOWN, self._async_handle_flush_timer)
+        try:
+            # Shielded so a cancelled caller doesn't cancel the result other callers share.
+            await asyncio.shield(queued[1])
+        except Exception as error:
+            raise HomeAssistantError(
+                f"Failed to update Flair {resource_type} {resource_id}: {error}"
+            ) from error
+
+    async def _async_handle_flush_timer(self, _now: datetime) -> None:
+        """Send the writes queued during the cooldown."""
+        self._unsub_flush = None
+        await self._async_flush_writes()
+
+    async def _async_flush_writes(self) -> None:
+        """Send one update per resource with all attributes queued for it."""
+        async with self._flush_lock:
+            failed = False
+            # Writes queued while a request is in flight are picked up by the next pass.
+            while self._pending_writes:
+                pending, self._pending_writes = self._pending_writes, {}
+                try:
+                    for (resource_type, resource_id), (attributes, result) in pending.items():
+                        try:
+                            await self.client.update(resource_type, resource_id, attributes=attributes, relationships={})
+                        except Exception as error:
+                            # Hand any error to the waiting callers and keep sending the rest
+                            # of the batch; one refresh below covers every failure.
+                            failed = True
+                            result.set_exception(error)
+                        else:
+                            result.set_result(None)
+                finally:
+                    # A cancelled flush must not leave callers waiting forever.
+                    for _attributes, result in pending.values():
+                        if not result.done():
+                            result.cancel()
+            # Restore the real state in place of the optimistic one.
+            if failed and not self._writes_closed:
+                await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Send queued writes and stop scheduling new flushes before shutting down."""
+        self._writes_closed = True
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self._async_flush_writes()
+        await super().async_shutdown()
 
     async def _async_update_data(self) -> FlairData:
         """Fetch data from Flair."""
 
         try:
             data = await self.client.get_flair_data()
-            nl = '\n'
-            LOGGER.debug(f'Found the following Flair structures/devices: {nl}{json.dumps(data, default=vars, indent=4)}')
+            # Dumping every structure and device is costly, so only do it when it will be logged.
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Found the following Flair structures/devices: \n%s', json.dumps(data, default=vars, indent=4))
         except FlairAuthError as error:
             raise ConfigEntryAuthFailed(error) from error
-        except FlairError as error:
+        except FLAIR_ERRORS as error:
             raise UpdateFailed(error) from error
         if not data.structures:
             raise UpdateFailed("No Structures found")
+        # Keep the current objects when nothing changed so listeners are skipped
+        # and entities keep operating on the data the coordinator exposes.
+        if data == self.data:
+            return self.data
         return data
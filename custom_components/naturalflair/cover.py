@@ -159,10 +159,11 @@ class FlairVent(CoordinatorEntity, CoverEntity):
         await self.coordinator.async_request_refresh()
 
         if not self.manual_struct_room:
-            LOGGER.warning(f'''Flair structure or room not in manual mode.
-                            Position changes to your Flair vent {self.vent_data.attributes["name"]}
+            LOGGER.warning('''Flair structure or room not in manual mode.
+                            Position changes to your Flair vent %s
                             will eventually be reversed by Flair.
-                            '''
+                            ''',
+                            self.vent_data.attributes["name"],
                           )
 
     async def async_close_cover_tilt(self, **kwargs) -> None:
@@ -175,10 +176,11 @@ class FlairVent(CoordinatorEntity, CoverEntity):
         await self.coordinator.async_request_refresh()
 
         if not self.manual_struct_room:
-            LOGGER.warning(f'''Flair structure or room not in manual mode.
-                            Position changes to your Flair vent {self.vent_data.attributes["name"]}
+            LOGGER.warning('''Flair structure or room not in manual mode.
+                            Position changes to your Flair vent %s
                             will eventually be reversed by Flair.
-                            '''
+                            ''',
+                            self.vent_data.attributes["name"],
                           )
 
     async def async_set_cover_tilt_position(self, **kwargs) -> None:
@@ -197,10 +199,11 @@ class FlairVent(CoordinatorEntity, CoverEntity):
             await self.coordinator.async_request_refresh()
 
             if not self.manual_struct_room:
-                LOGGER.warning(f'''Flair structure or room not in manual mode.
-                                Position changes to your Flair vent {self.vent_data.attributes["name"]}
+                LOGGER.warning('''Flair structure or room not in manual mode.
+                                Position changes to your Flair vent %s
                                 will eventually be reversed by Flair.
-                                '''
+                                ''',
+                                self.vent_data.attributes["name"],
                               )
 
     @staticmethod
@@ -0,0 +1,17 @@
+"""Base entity for Flair Integration"""
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class FlairCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that derives its availability on each coordinator update.
+
+    Subclasses set _attr_available while resolving their data, so reading
+    the state doesn't repeat the lookups.
+    """
+
+    @property
+    def available(self) -> bool:
+        """Return the availability derived on the last coordinator update."""
+        return self._attr_available
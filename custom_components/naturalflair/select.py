@@ -1,16 +1,18 @@
 """Select platform for Flair integration."""
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 from flairaio.model import Puck, Structure
 
-from homeassistant.components.select import SelectEntity
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     AWAY_MODES,
@@ -24,12 +26,179 @@ from .const import (
     TEMPERATURE_SCALES,
 )
 from .coordinator import FlairDataUpdateCoordinator
+from .entity import FlairCoordinatorEntity
+from .util import mirror_attributes
+
+
+# Reverse maps for converting from HA -> Flair
+DEFAULT_HOLD_TO_FLAIR = MappingProxyType(dict(zip(DEFAULT_HOLD_DURATION.values(), DEFAULT_HOLD_DURATION.keys())))
+HOME_AWAY_SET_BY_TO_FLAIR = MappingProxyType(dict(zip(HOME_AWAY_SET_BY.values(), HOME_AWAY_SET_BY.keys())))
+SET_POINT_CONTROLLER_TO_FLAIR = MappingProxyType(dict(zip(SET_POINT_CONTROLLER.values(), SET_POINT_CONTROLLER.keys())))
+TEMP_SCALE_TO_FLAIR = MappingProxyType(dict(zip(TEMPERATURE_SCALES.values(), TEMPERATURE_SCALES.keys())))
+
+# Flair reports these values in lowercase, HA shows them capitalized.
+SYSTEM_MODE_FROM_FLAIR = MappingProxyType({mode.lower(): mode for mode in SYSTEM_MODES})
+SYSTEM_MODE_TO_FLAIR = MappingProxyType(dict(zip(SYSTEM_MODE_FROM_FLAIR.values(), SYSTEM_MODE_FROM_FLAIR.keys())))
+PUCK_BACKGROUND_FROM_FLAIR = MappingProxyType({color.lower(): color for color in PUCK_BACKGROUND})
+PUCK_BACKGROUND_TO_FLAIR = MappingProxyType(dict(zip(PUCK_BACKGROUND_FROM_FLAIR.values(), PUCK_BACKGROUND_FROM_FLAIR.keys())))
+
+# Flair stores home/away as a boolean.
+HOME_AWAY_FROM_FLAIR = MappingProxyType({True: "Home", False: "Away"})
+HOME_AWAY_TO_FLAIR = MappingProxyType(dict(zip(HOME_AWAY_FROM_FLAIR.values(), HOME_AWAY_FROM_FLAIR.keys())))
+
+# Option lists that don't change at runtime, built once at import.
+DEFAULT_HOLD_OPTIONS = tuple(DEFAULT_HOLD_DURATION.values())
+HOME_AWAY_SET_BY_OPTIONS_FULL = tuple(HOME_AWAY_SET_BY.values())
+HOME_AWAY_SET_BY_OPTIONS_MIN = ("Manual", "Flair App Geolocation")
+SET_POINT_OPTIONS_FULL = tuple(SET_POINT_CONTROLLER.values())
+SET_POINT_OPTIONS_APP = ("Flair App",)
+TEMP_SCALE_OPTIONS = tuple(TEMPERATURE_SCALES.values())
+
+# Icons keyed by the current Flair value.
+HOME_AWAY_ICONS = {
+    True: "mdi:location-enter",
+    False: "mdi:location-exit",
+}
+HOME_AWAY_SET_BY_ICONS = {
+    "Manual": "mdi:account-circle",
+    "Third Party Home Away": "mdi:thermostat",
+    "Flair Autohome Autoaway": "mdi:cellphone",
+}
+TEMP_SCALE_ICONS = {
+    "F": "mdi:temperature-fahrenheit",
+    "C": "mdi:temperature-celsius",
+    "K": "mdi:temperature-kelvin",
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class FlairSelectEntityDescription(SelectEntityDescription):
+    """Describes a Flair select entity backed by a single Flair attribute."""
+
+    # Flair attribute read for the current option and written on selection.
+    attr_key: str
+    # Flair resource type that owns attr_key.
+    resource: str = "structures"
+    # Flair value -> option. Without one the Flair value is shown as is.
+    forward_map: Mapping[Any, str] | None = None
+    # Option -> Flair value. Without one the option is written as is.
+    reverse_map: Mapping[str, Any] | None = None
+    # Option returned when the Flair value isn't in forward_map.
+    default_option: str | None = None
+    # Flair value -> icon. Falls back to icon.
+    icon_map: Mapping[Any, str] | None = None
+    # Options offered instead of options when the structure has a thermostat.
+    thermostat_options: list[str] | None = None
+    # Unavailable, and disabled on registration, while the structure is in manual mode.
+    requires_auto_mode: bool = False
+    # Unavailable while the puck is inactive.
+    requires_active_puck: bool = False
+
+
+STRUCTURE_SELECTS: tuple[FlairSelectEntityDescription, ...] = (
+    FlairSelectEntityDescription(
+        key="system_mode",
+        name="System mode",
+        icon="mdi:home-circle",
+        options=list(SYSTEM_MODES),
+        attr_key="mode",
+        forward_map=SYSTEM_MODE_FROM_FLAIR,
+        reverse_map=SYSTEM_MODE_TO_FLAIR,
+    ),
+    FlairSelectEntityDescription(
+        key="home_away_mode",
+        name="Home/Away",
+        icon="mdi:location-exit",
+        options=list(HOME_AWAY_MODE),
+        attr_key="home",
+        forward_map=HOME_AWAY_FROM_FLAIR,
+        reverse_map=HOME_AWAY_TO_FLAIR,
+        default_option="Away",
+        icon_map=HOME_AWAY_ICONS,
+        requires_auto_mode=True,
+    ),
+    FlairSelectEntityDescription(
+        key="home_away_set_by",
+        name="Home/Away mode set by",
+        icon="mdi:account-circle",
+        entity_category=EntityCategory.CONFIG,
+        options=list(HOME_AWAY_SET_BY_OPTIONS_MIN),
+        thermostat_options=list(HOME_AWAY_SET_BY_OPTIONS_FULL),
+        attr_key="home-away-mode",
+        forward_map=HOME_AWAY_SET_BY,
+        reverse_map=HOME_AWAY_SET_BY_TO_FLAIR,
+        icon_map=HOME_AWAY_SET_BY_ICONS,
+        requires_auto_mode=True,
+    ),
+    FlairSelectEntityDescription(
+        key="default_hold_duration",
+        name="Default hold duration",
+        icon="mdi:timer",
+        entity_category=EntityCategory.CONFIG,
+        options=list(DEFAULT_HOLD_OPTIONS),
+        attr_key="default-hold-duration",
+        forward_map=DEFAULT_HOLD_DURATION,
+        reverse_map=DEFAULT_HOLD_TO_FLAIR,
+        requires_auto_mode=True,
+    ),
+    FlairSelectEntityDescription(
+        key="set_point_controller",
+        name="Set point controller",
+        icon="mdi:controller",
+        entity_category=EntityCategory.CONFIG,
+        options=list(SET_POINT_OPTIONS_APP),
+        thermostat_options=list(SET_POINT_OPTIONS_FULL),
+        attr_key="set-point-mode",
+        forward_map=SET_POINT_CONTROLLER,
+        reverse_map=SET_POINT_CONTROLLER_TO_FLAIR,
+        requires_auto_mode=True,
+    ),
+    FlairSelectEntityDescription(
+        key="away_mode",
+        name="Away Mode",
+        icon="mdi:clipboard-list",
+        entity_category=EntityCategory.CONFIG,
+        options=list(AWAY_MODES),
+        attr_key="structure-away-mode",
+        requires_auto_mode=True,
+    ),
+)
 
+SCHEDULE_SELECT = FlairSelectEntityDescription(
+    key="schedule",
+    name="Active schedule",
+    icon="mdi:calendar",
+    attr_key="active-schedule-id",
+    requires_auto_mode=True,
+)
 
-DEFAULT_HOLD_TO_FLAIR = {v: k for (k, v) in DEFAULT_HOLD_DURATION.items()}
-HOME_AWAY_SET_BY_TO_FLAIR = {v: k for (k, v) in HOME_AWAY_SET_BY.items()}
-SET_POINT_CONTROLLER_TO_FLAIR = {v: k for (k, v) in SET_POINT_CONTROLLER.items()}
-TEMP_SCALE_TO_FLAIR = {v: k for (k, v) in TEMPERATURE_SCALES.items()}
+PUCK_SELECTS: tuple[FlairSelectEntityDescription, ...] = (
+    FlairSelectEntityDescription(
+        key="background_color",
+        name="Background color",
+        icon="mdi:invert-colors",
+        entity_category=EntityCategory.CONFIG,
+        options=list(PUCK_BACKGROUND),
+        attr_key="puck-display-color",
+        resource="pucks",
+        forward_map=PUCK_BACKGROUND_FROM_FLAIR,
+        reverse_map=PUCK_BACKGROUND_TO_FLAIR,
+        requires_active_puck=True,
+    ),
+    # The temperature scale is a structure setting, shown on each puck.
+    FlairSelectEntityDescription(
+        key="temp_scale",
+        name="Temperature scale",
+        icon="mdi:thermometer",
+        entity_category=EntityCategory.CONFIG,
+        options=list(TEMP_SCALE_OPTIONS),
+        attr_key="temperature-scale",
+        forward_map=TEMPERATURE_SCALES,
+        reverse_map=TEMP_SCALE_TO_FLAIR,
+        default_option="Fahrenheit",
+        icon_map=TEMP_SCALE_ICONS,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -38,519 +207,167 @@ async def async_setup_entry(
     """Set Up Flair Select Entities."""
 
     coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    selects = []
+
+    async_add_entities(_iter_select_entities(coordinator))
+
+
+def _iter_select_entities(
+    coordinator: FlairDataUpdateCoordinator,
+) -> Iterator[SelectEntity]:
+    """Yield every select entity for the structures known to the coordinator."""
 
     for structure_id, structure_data in coordinator.data.structures.items():
         # Structures
-        selects.extend((
-            SystemMode(coordinator, structure_id),
-            HomeAwayMode(coordinator, structure_id),
-            HomeAwaySetBy(coordinator, structure_id),
-            DefaultHoldDuration(coordinator, structure_id),
-            SetPointController(coordinator, structure_id),
-            Schedule(coordinator, structure_id),
-            AwayMode(coordinator, structure_id),
-        ))
+        for description in STRUCTURE_SELECTS:
+            yield FlairSelect(coordinator, description, structure_id)
+        yield Schedule(coordinator, SCHEDULE_SELECT, structure_id)
 
         # Pucks
         if structure_data.pucks:
-            for puck_id, puck_data in structure_data.pucks.items():
-                selects.extend((
-                    PuckBackground(coordinator, structure_id, puck_id),
-                    PuckTempScale(coordinator, structure_id, puck_id),
-                ))
-
-    async_add_entities(selects)
-
+            for puck_id in structure_data.pucks:
+                for description in PUCK_SELECTS:
+                    yield FlairSelect(coordinator, description, structure_id, puck_id)
 
-class SystemMode(CoordinatorEntity, SelectEntity):
-    """Representation of System Mode."""
 
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
+class FlairSelect(FlairCoordinatorEntity, SelectEntity):
+    """Representation of a Flair structure or puck setting."""
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
+    # Only this entity's own fields; _attr_* values stay in the instance dict.
+    __slots__ = ("structure_id", "puck_id", "_structure", "_puck", "_resource_data")
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_system_mode"
+    entity_description: FlairSelectEntityDescription
+    _attr_has_entity_name = True
 
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "System mode"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:home-circle"
-
-    @property
-    def current_option(self) -> str:
-        """Returns currently active system mode."""
-        current_mode = self.structure_data.attributes["mode"]
-        return current_mode.capitalize()
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available system modes."""
-        return SYSTEM_MODES
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        lowercase_option = option[0].lower() + option[1:]
-        attributes = self.set_attributes(str(lowercase_option))
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["mode"] = lowercase_option
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(mode: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"mode": mode}
-
-
-class HomeAwayMode(CoordinatorEntity, SelectEntity):
-    """Representation of Home/Away Mode."""
-
-    def __init__(self, coordinator, structure_id):
+    def __init__(
+        self,
+        coordinator: FlairDataUpdateCoordinator,
+        description: FlairSelectEntityDescription,
+        structure_id: str,
+        puck_id: str | None = None,
+    ) -> None:
         super().__init__(coordinator)
+        self.entity_description = description
         self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_id)},
-            "name": self.structure_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_home_away_mode"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Home/Away"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:location-enter" if self.structure_data.attributes["home"] else "mdi:location-exit"
-
-    @property
-    def current_option(self) -> str | None:
-        """Returns currently active home/away mode."""
-        currently_home = self.structure_data.attributes["home"]
-        return "Home" if currently_home else "Away"
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available home/away modes."""
-        return HOME_AWAY_MODE
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-        system_mode = self.structure_data.attributes["mode"]
-        return system_mode != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Marks entity as unavailable if system mode is set to Manual."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        attributes = self.set_attributes(option)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["home"] = attributes["home"]
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(mode: str) -> dict[str, bool]:
-        """Creates attributes dictionary."""
-        return {"home": (mode == "Home")}
-
-
-class HomeAwaySetBy(CoordinatorEntity, SelectEntity):
-    """Representation of what sets Home/Away Mode."""
-
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_home_away_set_by"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Home/Away mode set by"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to config."""
-        return EntityCategory.CONFIG
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        mode = self.structure_data.attributes["home-away-mode"]
-        if mode == "Manual":
-            return "mdi:account-circle"
-        elif mode == "Third Party Home Away":
-            return "mdi:thermostat"
-        elif mode == "Flair Autohome Autoaway":
-            return "mdi:cellphone"
-        return "mdi:account-circle"
-
-    @property
-    def current_option(self) -> str | None:
-        """Returns currently active home/away mode setter."""
-        current = self.structure_data.attributes["home-away-mode"]
-        return HOME_AWAY_SET_BY.get(current)
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available home/away setters."""
-        if self.structure_data.thermostats:
-            return list(HOME_AWAY_SET_BY.values())
+        self.puck_id = puck_id
+        self._resolve_data()
+        structure_data = self.structure_data
+        if puck_id is None:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, structure_data.id)},
+                "name": structure_data.attributes["name"],
+                "manufacturer": "Flair",
+                "model": "Structure",
+                "configuration_url": "https://my.flair.co/",
+            }
+            device_id = structure_data.id
         else:
-            return ["Manual", "Flair App Geolocation"]
+            puck_data = self.puck_data
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, puck_data.id)},
+                "name": puck_data.attributes["name"],
+                # Some pucks might have 'make-name' in attributes
+                "manufacturer": puck_data.attributes.get("make-name", "Flair"),
+                "model": "Puck",
+                "configuration_url": "https://my.flair.co/",
+            }
+            device_id = puck_data.id
+        self._attr_unique_id = f"{device_id}_{description.key}"
+        # Thermostat options are only offered when the structure has one.
+        if description.thermostat_options is not None and structure_data.thermostats:
+            self._attr_options = description.thermostat_options
+        elif description.options is not None:
+            self._attr_options = description.options
+        if description.requires_auto_mode:
+            self._attr_entity_registry_enabled_default = structure_data.attributes["mode"] != "manual"
+
+    def _resolve_data(self) -> None:
+        """Look up this entity's structure and puck once per coordinator update."""
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        self._puck = None if self.puck_id is None else self._structure.pucks[self.puck_id]
+        description = self.entity_description
+        self._resource_data = self._puck if description.resource == "pucks" else self._structure
+        # Unavailable if system mode is manual or the puck is inactive.
+        if description.requires_auto_mode:
+            self._attr_available = self._structure.attributes["mode"] != "manual"
+        elif description.requires_active_puck:
+            self._attr_available = not self._puck.attributes["inactive"]
+        else:
+            self._attr_available = self.coordinator.last_update_success
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Marks entity as unavailable if system mode is set to Manual."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        ha_to_flair = HOME_AWAY_SET_BY_TO_FLAIR.get(option)
-        attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["home-away-mode"] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(setter: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"home-away-mode": setter}
-
-
-class DefaultHoldDuration(CoordinatorEntity, SelectEntity):
-    """Representation of default hold duration setting."""
-
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._resolve_data()
+        super()._handle_coordinator_update()
 
     @property
     def structure_data(self) -> Structure:
         """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_default_hold_duration"
+        return self._structure
 
     @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Default hold duration"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to config."""
-        return EntityCategory.CONFIG
+    def puck_data(self) -> Puck | None:
+        """Handle coordinator puck data."""
+        return self._puck
 
     @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:timer"
+    def icon(self) -> str | None:
+        """Set icon based on the current value when the description maps one."""
+        description = self.entity_description
+        if description.icon_map is None:
+            return description.icon
+        value = self._resource_data.attributes[description.attr_key]
+        return description.icon_map.get(value, description.icon)
 
     @property
     def current_option(self) -> str | None:
-        """Returns currently active default hold duration."""
-        current = self.structure_data.attributes["default-hold-duration"]
-        return DEFAULT_HOLD_DURATION.get(current)
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available default hold durations."""
-        return list(DEFAULT_HOLD_DURATION.values())
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Marks entity as unavailable if system mode is set to Manual."""
-        return self.structure_data.attributes["mode"] != "manual"
+        """Returns the currently selected option."""
+        description = self.entity_description
+        value = self._resource_data.attributes[description.attr_key]
+        if description.forward_map is None:
+            return value
+        return description.forward_map.get(value, description.default_option)
+
+    def _to_flair(self, option: str) -> Any:
+        """Convert an option to the value Flair stores."""
+        reverse_map = self.entity_description.reverse_map
+        return option if reverse_map is None else reverse_map.get(option)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        ha_to_flair = DEFAULT_HOLD_TO_FLAIR.get(option)
-        attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["default-hold-duration"] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(duration: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"default-hold-duration": duration}
-
-
-class SetPointController(CoordinatorEntity, SelectEntity):
-    """Representation of set point controller setting."""
-
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_set_point_controller"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Set point controller"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to config."""
-        return EntityCategory.CONFIG
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:controller"
-
-    @property
-    def current_option(self) -> str | None:
-        """Returns current set point controller."""
-        current = self.structure_data.attributes["set-point-mode"]
-        return SET_POINT_CONTROLLER.get(current)
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available set point controllers."""
-        if self.structure_data.thermostats:
-            return list(SET_POINT_CONTROLLER.values())
-        return ["Flair App"]
+        if option == self.current_option:
+            return
+        description = self.entity_description
+        attributes = {description.attr_key: self._to_flair(option)}
+        if mirror_attributes(self._resource_data.attributes, attributes):
+            self.coordinator.async_update_listeners()
+        await self.coordinator.async_queue_update(description.resource, self._resource_data.id, attributes)
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Marks entity as unavailable if system mode is set to Manual."""
-        return self.structure_data.attributes["mode"] != "manual"
 
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        ha_to_flair = SET_POINT_CONTROLLER_TO_FLAIR.get(option)
-        attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["set-point-mode"] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(option: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"set-point-mode": option}
-
-
-class Schedule(CoordinatorEntity, SelectEntity):
+class Schedule(FlairSelect):
     """Representation of available structure schedules."""
 
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
+    # Schedules the lookups were last built from.
+    _schedules_source: dict[str, Any] | None = None
 
-    @property
-    def schedules(self) -> dict[str, str]:
-        """Create dictionary with all available schedules."""
+    def _resolve_data(self) -> None:
+        """Look up the structure and rebuild id <-> name lookups when its schedules change."""
+        super()._resolve_data()
+        schedules_source = self.structure_data.schedules
+        if schedules_source is not None and schedules_source is self._schedules_source:
+            return
+        self._schedules_source = schedules_source
         schedules: dict[str, str] = {"No Schedule": "No Schedule"}
-        if self.structure_data.schedules:
-            for sid, schedule_obj in self.structure_data.schedules.items():
+        if schedules_source:
+            for sid, schedule_obj in schedules_source.items():
                 schedules[schedule_obj.id] = schedule_obj.attributes["name"]
-        return schedules
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_schedule"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Active schedule"
+        self._schedules = schedules
+        self._schedule_ids = {v: k for k, v in schedules.items()}
+        self._attr_options = list(schedules.values())
 
     @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:calendar"
+    def schedules(self) -> dict[str, str]:
+        """Return dictionary with all available schedules."""
+        return self._schedules
 
     @property
     def current_option(self) -> str:
@@ -560,304 +377,6 @@ class Schedule(CoordinatorEntity, SelectEntity):
             return "No Schedule"
         return self.schedules.get(active_schedule, "No Schedule")
 
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available schedules."""
-        return list(self.schedules.values())
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Marks entity as unavailable if system mode is set to Manual."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        schedule_name_to_id = {v: k for k, v in self.schedules.items()}
-        ha_to_flair = None if option == "No Schedule" else schedule_name_to_id.get(option)
-
-        attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["active-schedule-id"] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(option: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"active-schedule-id": option}
-
-
-class AwayMode(CoordinatorEntity, SelectEntity):
-    """Representation of structure away mode setting."""
-
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.structure_data.id}_away_mode"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Away Mode"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to config."""
-        return EntityCategory.CONFIG
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:clipboard-list"
-
-    @property
-    def current_option(self) -> str:
-        """Returns current away mode setting."""
-        return self.structure_data.attributes["structure-away-mode"]
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available away modes."""
-        return AWAY_MODES
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    @property
-    def available(self) -> bool:
-        """Marks entity as unavailable if system mode is set to Manual."""
-        return self.structure_data.attributes["mode"] != "manual"
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        attributes = self.set_attributes(option)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.structure_data.attributes["structure-away-mode"] = option
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(option: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"structure-away-mode": option}
-
-
-class PuckBackground(CoordinatorEntity, SelectEntity):
-    """Representation of puck background color."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes["name"],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.puck_data.id}_background_color"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Background color"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to config."""
-        return EntityCategory.CONFIG
-
-    @property
-    def icon(self) -> str:
-        """Set icon."""
-        return "mdi:invert-colors"
-
-    @property
-    def current_option(self) -> str:
-        """Returns current puck background color."""
-        return self.puck_data.attributes["puck-display-color"].capitalize()
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available puck background colors."""
-        return PUCK_BACKGROUND
-
-    @property
-    def available(self) -> bool:
-        """Return true if puck is active."""
-        return not self.puck_data.attributes["inactive"]
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        ha_to_flair = option.lower()
-        attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update(
-            "pucks",
-            self.puck_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.puck_data.attributes["puck-display-color"] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(option: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"puck-display-color": option}
-
-
-class PuckTempScale(CoordinatorEntity, SelectEntity):
-    """Representation of puck temp scale selection."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-        # Some pucks might have 'make-name' in attributes
-        manufacturer = self.puck_data.attributes.get("make-name", "Flair")
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes["name"],
-            "manufacturer": manufacturer,
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-        return f"{self.puck_data.id}_temp_scale"
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-        return "Temperature scale"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-        return True
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to config."""
-        return EntityCategory.CONFIG
-
-    @property
-    def icon(self) -> str:
-        """Set icon based on the current scale."""
-        temp_scale = self.structure_data.attributes["temperature-scale"]
-        if temp_scale == "F":
-            return "mdi:temperature-fahrenheit"
-        if temp_scale == "C":
-            return "mdi:temperature-celsius"
-        if temp_scale == "K":
-            return "mdi:temperature-kelvin"
-        return "mdi:thermometer"
-
-    @property
-    def current_option(self) -> str:
-        """Returns current puck temp scale."""
-        current_scale = self.structure_data.attributes["temperature-scale"]
-        return TEMPERATURE_SCALES.get(current_scale, "Fahrenheit")
-
-    @property
-    def options(self) -> list[str]:
-        """Return list of all the available temperature scales."""
-        return list(TEMPERATURE_SCALES.values())
-
-    async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        ha_to_flair = TEMP_SCALE_TO_FLAIR.get(option)
-        attributes = self.set_attributes(ha_to_flair)
-        await self.coordinator.client.update(
-            "structures",
-            self.structure_data.id,
-            attributes=attributes,
-            relationships={},
-        )
-        self.puck_data.attributes["temperature-scale"] = ha_to_flair
-        self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
-
-    @staticmethod
-    def set_attributes(option: str) -> dict[str, str]:
-        """Creates attributes dictionary."""
-        return {"temperature-scale": option}
+    def _to_flair(self, option: str) -> str | None:
+        """Convert a schedule name to its id, or None for no schedule."""
+        return None if option == "No Schedule" else self._schedule_ids.get(option)
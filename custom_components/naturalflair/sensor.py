@@ -1,14 +1,17 @@
 """Sensor platform for Flair integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from flairaio.model import Bridge, Puck, Room, Structure, Vent
+from flairaio.model import Bridge, HVACUnit, Puck, Room, Structure, Vent
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -21,1391 +24,615 @@ from homeassistant.const import(
     UnitOfTemperature,
 
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, TYPE_TO_MODEL
 from .coordinator import FlairDataUpdateCoordinator
+from .entity import FlairCoordinatorEntity
+
+
+# Bound once for the hold-until sensors.
+_fromisoformat = datetime.fromisoformat
+
+
+def _device_active(device_data: Puck | Vent) -> bool:
+    """Return true if the puck or vent isn't inactive."""
+
+    return not device_data.attributes['inactive']
+
+
+def _puck_light(puck_data: Puck) -> float | None:
+    """Return current lux level.
+
+    The reading is in hundredths of a Volt at 200 lux
+    per Volt, which works out to 2 lux per unit.
+    """
+
+    light = puck_data.current_reading['light']
+    return None if light is None else light * 2.0
+
+
+def _rounded_pressure(pressure: float | None) -> float | None:
+    """Round a pressure reading to two decimals."""
+
+    return round(pressure, 2) if pressure else pressure
+
+
+@dataclass(frozen=True, kw_only=True)
+class FlairDeviceSensorEntityDescription(SensorEntityDescription):
+    """Describes a Flair puck or vent sensor."""
+
+    # Returns the native value from the puck or vent.
+    value_fn: Callable[[Puck | Vent], Any]
+    # Returns whether the puck or vent can report this value.
+    available_fn: Callable[[Puck | Vent], bool] = _device_active
+
+
+PUCK_SENSORS: tuple[FlairDeviceSensorEntityDescription, ...] = (
+    FlairDeviceSensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda puck_data: puck_data.attributes['current-temperature-c'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="humidity",
+        name="Humidity",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda puck_data: puck_data.attributes['current-humidity'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="light",
+        name="Light",
+        native_unit_of_measurement=LIGHT_LUX,
+        device_class=SensorDeviceClass.ILLUMINANCE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_puck_light,
+        available_fn=lambda puck_data: (
+            not puck_data.attributes['inactive']
+            and puck_data.current_reading['light'] is not None
+        ),
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="voltage",
+        name="Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda puck_data: puck_data.attributes['voltage'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="rssi",
+        name="RSSI",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda puck_data: puck_data.attributes['current-rssi'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="pressure",
+        name="Pressure",
+        native_unit_of_measurement=UnitOfPressure.KPA,
+        device_class=SensorDeviceClass.PRESSURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda puck_data: _rounded_pressure(puck_data.current_reading.get('room-pressure')),
+    ),
+)
 
+VENT_SENSORS: tuple[FlairDeviceSensorEntityDescription, ...] = (
+    FlairDeviceSensorEntityDescription(
+        key="duct_temperature",
+        name="Duct temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda vent_data: vent_data.current_reading['duct-temperature-c'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="duct_pressure",
+        name="Duct pressure",
+        native_unit_of_measurement=UnitOfPressure.KPA,
+        device_class=SensorDeviceClass.PRESSURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda vent_data: _rounded_pressure(vent_data.current_reading.get('duct-pressure')),
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="voltage",
+        name="Voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda vent_data: vent_data.attributes['voltage'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="rssi",
+        name="RSSI",
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda vent_data: vent_data.attributes['current-rssi'],
+    ),
+    FlairDeviceSensorEntityDescription(
+        key="reported_state",
+        name="Reported state",
+        native_unit_of_measurement=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda vent_data: vent_data.current_reading['percent-open'],
+    ),
+)
 
-async def async_setup_entry(
-    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
-) -> None:
-    """Set Up Flair Sensor Entities."""
-
-    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    sensors = []
-
-    for structure_id, structure_data in coordinator.data.structures.items():
-            # Structures
-            sensors.extend((
-                HomeAwayHoldUntil(coordinator, structure_id),
-            ))
-
-            # Pucks
-            if structure_data.pucks:
-                for puck_id, puck_data in structure_data.pucks.items():
-                    sensors.extend((
-                        PuckTemp(coordinator, structure_id, puck_id),
-                        PuckHumidity(coordinator, structure_id, puck_id),
-                        PuckLight(coordinator, structure_id, puck_id),
-                        PuckVoltage(coordinator, structure_id, puck_id),
-                        PuckRSSI(coordinator, structure_id, puck_id),
-                        PuckPressure(coordinator, structure_id, puck_id),
-                        Gateway(coordinator, structure_id, puck_id, 'pucks')
-                    ))
-            # Vents
-            if structure_data.vents:
-                for vent_id, vent_data in structure_data.vents.items():
-                    sensors.extend((
-                        DuctTemp(coordinator, structure_id, vent_id),
-                        DuctPressure(coordinator, structure_id, vent_id),
-                        VentVoltage(coordinator, structure_id, vent_id),
-                        VentRSSI(coordinator, structure_id, vent_id),
-                        VentReportedState(coordinator, structure_id, vent_id),
-                        Gateway(coordinator, structure_id, vent_id, 'vents')
-                    ))
-            # Rooms
-            if structure_data.rooms:
-                for room_id, room_data in structure_data.rooms.items():
-                    sensors.extend((
-                        HoldTempUntil(coordinator, structure_id, room_id),
-                    ))
-
-            # HVAC Units with only button controls
-            if structure_data.hvac_units:
-                for hvac_id, hvac_data in structure_data.hvac_units.items():
-                    constraints = structure_data.hvac_units[hvac_id].attributes['constraints']
-                    if isinstance(constraints, list):
-                        sensors.append(LastButtonPressed(coordinator, structure_id, hvac_id))
-
-            # Bridges
-            if structure_data.bridges:
-                for bridge_id, bridge_data in structure_data.bridges.items():
-                    sensors.append(BridgeRSSI(coordinator, structure_id, bridge_id))
-
-    async_add_entities(sensors)
-
-
-class HomeAwayHoldUntil(CoordinatorEntity, SensorEntity):
-    """Representation of default hold duration setting."""
-
-    def __init__(self, coordinator, structure_id):
-        super().__init__(coordinator)
-        self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.structure_data.id)},
-            "name": self.structure_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Structure",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.structure_data.id) + '_home_away_hold_until'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Home/Away holding until"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> datetime:
-        """Date/time when hold will end.
-
-        When home/away is set manually, returns date/time when hold will end.
-        Only applicable if structure default hold duration is anything other
-        than 'until next scheduled event'
-        """
-
-        if self.structure_data.attributes['hold-until']:
-            return datetime.fromisoformat(self.structure_data.attributes['hold-until'])
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.TIMESTAMP
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
-
-        system_mode = self.structure_data.attributes['mode']
-        if system_mode == 'manual':
-            return False
-        else:
-            return True
-
-    @property
-    def available(self) -> bool:
-        """Determine whether entity is available. 
-
-        Return true if home/away is set manually and structure
-        has a default hold duration other than next event.
-        """
-
-        if self.structure_data.attributes['hold-until']:
-            return True
-        else:
-            return False
-
-
-class PuckTemp(CoordinatorEntity, SensorEntity):
-    """Representation of Puck Temperature."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.puck_data.id) + '_temperature'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Temperature"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return current temperature in Celsius."""
-
-        return self.puck_data.attributes['current-temperature-c']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTemperature:
-        """Return Celsius as the native unit."""
-
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.puck_data.attributes['inactive']:
-            return True
-        else:
-            return False
-
-
-class PuckHumidity(CoordinatorEntity, SensorEntity):
-    """Representation of Puck Humidity."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.puck_data.id) + '_humidity'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Humidity"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return current humidity."""
-
-        return self.puck_data.attributes['current-humidity']
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return percent as the native unit."""
-
-        return PERCENTAGE
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.HUMIDITY
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.puck_data.attributes['inactive']:
-            return True
-        else:
-            return False
-
-
-class PuckLight(CoordinatorEntity, SensorEntity):
-    """Representation of Puck Light."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.puck_data.id) + '_light'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Light"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return current lux level. 
-
-        Convert value to Volts then multiply by 200
-        for 200 lux per Volt.
-        """
-
-        return (self.puck_data.current_reading['light'] / 100) * 200
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return lux as the native unit."""
-
-        return LIGHT_LUX
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.ILLUMINANCE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if (self.puck_data.attributes['inactive'] == False) and \
-                (self.puck_data.current_reading['light'] is not None):
-            return True
-        else:
-            return False
-
-
-class PuckVoltage(CoordinatorEntity, SensorEntity):
-    """Representation of Puck Voltage."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.puck_data.id) + '_voltage'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Voltage"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return voltage measurement."""
-
-        return self.puck_data.attributes['voltage']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfElectricPotential:
-        """Return volts as the native unit."""
-
-        return UnitOfElectricPotential.VOLT
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.VOLTAGE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.puck_data.attributes['inactive']:
-            return True
-        else:
-            return False
-
-
-class PuckRSSI(CoordinatorEntity, SensorEntity):
-    """Representation of Puck RSSI."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.puck_data.id) + '_rssi'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "RSSI"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return RSSI reading."""
-
-        return self.puck_data.attributes['current-rssi']
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return dBm as the native unit."""
-
-        return SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.SIGNAL_STRENGTH
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.puck_data.attributes['inactive']:
-            return True
-        else:
-            return False
-
-
-class PuckPressure(CoordinatorEntity, SensorEntity):
-    """Representation of Puck pressure reading."""
-
-    def __init__(self, coordinator, structure_id, puck_id):
-        super().__init__(coordinator)
-        self.puck_id = puck_id
-        self.structure_id = structure_id
-
-    @property
-    def puck_data(self) -> Puck:
-        """Handle coordinator puck data."""
-
-        return self.coordinator.data.structures[self.structure_id].pucks[self.puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.puck_data.id)},
-            "name": self.puck_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Puck",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.puck_data.id) + '_pressure'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Pressure"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float | None:
-        """Return pressure reading."""
-        pressure = self.puck_data.current_reading.get('room-pressure')
-        return round(pressure, 2) if pressure else pressure
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfPressure:
-        """Return kPa as the native unit."""
-
-        return UnitOfPressure.KPA
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.PRESSURE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.puck_data.attributes['inactive']:
-            return True
-        else:
-            return False
-
-
-class DuctTemp(CoordinatorEntity, SensorEntity):
-    """Representation of Duct Temperature."""
-
-    def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
-        self.vent_id = vent_id
-        self.structure_id = structure_id
-
-    @property
-    def vent_data(self) -> Vent:
-        """Handle coordinator vent data."""
-
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.vent_data.id)},
-            "name": self.vent_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Vent",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.vent_data.id) + '_duct_temperature'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Duct temperature"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return current temperature in Celsius."""
-
-        return self.vent_data.current_reading['duct-temperature-c']
-
-    @property
-    def native_unit_of_measurement(self) -> UnitOfTemperature:
-        """Return Celsius as the native unit."""
-
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
-
-        return SensorDeviceClass.TEMPERATURE
-
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
-
-        return SensorStateClass.MEASUREMENT
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.vent_data.attributes['inactive']:
-            return True
-        else:
-            return False
-
-
-class DuctPressure(CoordinatorEntity, SensorEntity):
-    """Representation of Duct Pressure."""
-
-    def __init__(self, coordinator, structure_id, vent_id):
-        super().__init__(coordinator)
-        self.vent_id = vent_id
-        self.structure_id = structure_id
-
-    @property
-    def vent_data(self) -> Vent:
-        """Handle coordinator vent data."""
-
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.vent_data.id)},
-            "name": self.vent_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Vent",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.vent_data.id) + '_duct_pressure'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Duct pressure"
+HOME_AWAY_HOLD_UNTIL_SENSOR = SensorEntityDescription(
+    key="home_away_hold_until",
+    name="Home/Away holding until",
+    device_class=SensorDeviceClass.TIMESTAMP,
+)
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
+HOLD_UNTIL_SENSOR = SensorEntityDescription(
+    key="hold_until",
+    name="Temperature holding until",
+    device_class=SensorDeviceClass.TIMESTAMP,
+)
 
-        return True
+LAST_BUTTON_PRESSED_SENSOR = SensorEntityDescription(
+    key="last_button_pressed",
+    name="Last button pressed",
+    icon="mdi:hvac",
+)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return current pressure in kPa."""
-        pressure = self.vent_data.current_reading.get('duct-pressure')
-        return round(pressure, 2) if pressure else pressure
+BRIDGE_RSSI_SENSOR = SensorEntityDescription(
+    key="rssi",
+    name="RSSI",
+    native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+    state_class=SensorStateClass.MEASUREMENT,
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-    @property
-    def native_unit_of_measurement(self) -> UnitOfPressure:
-        """Return kPa as the native unit."""
+GATEWAY_SENSOR = SensorEntityDescription(
+    key="gateway",
+    name="Associated gateway",
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 
-        return UnitOfPressure.KPA
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set Up Flair Sensor Entities."""
 
-        return SensorDeviceClass.PRESSURE
+    coordinator: FlairDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
+    async_add_entities(_iter_sensor_entities(coordinator))
 
-        return SensorStateClass.MEASUREMENT
 
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
+def _iter_sensor_entities(
+    coordinator: FlairDataUpdateCoordinator,
+) -> Iterator[SensorEntity]:
+    """Yield every sensor entity for the structures known to the coordinator."""
 
-        if not self.vent_data.attributes['inactive']:
-            return True
-        else:
-            return False
+    for structure_id, structure_data in coordinator.data.structures.items():
+        # Structures
+        yield HomeAwayHoldUntil(coordinator, structure_id, structure_data)
+
+        # Pucks
+        for puck_id, puck_data in (structure_data.pucks or {}).items():
+            for description in PUCK_SENSORS:
+                yield FlairDeviceSensor(coordinator, description, structure_id, puck_id, 'pucks', puck_data)
+            yield Gateway(coordinator, structure_id, puck_id, 'pucks', structure_data, puck_data)
+        # Vents
+        for vent_id, vent_data in (structure_data.vents or {}).items():
+            for description in VENT_SENSORS:
+                yield FlairDeviceSensor(coordinator, description, structure_id, vent_id, 'vents', vent_data)
+            yield Gateway(coordinator, structure_id, vent_id, 'vents', structure_data, vent_data)
+        # Rooms
+        for room_id, room_data in (structure_data.rooms or {}).items():
+            yield HoldTempUntil(coordinator, structure_id, room_id, structure_data, room_data)
+
+        # HVAC Units with only button controls
+        for hvac_id, hvac_data in (structure_data.hvac_units or {}).items():
+            if isinstance(hvac_data.attributes['constraints'], list):
+                yield LastButtonPressed(coordinator, structure_id, hvac_id, structure_data, hvac_data)
+
+        # Bridges
+        for bridge_id, bridge_data in (structure_data.bridges or {}).items():
+            yield BridgeRSSI(coordinator, structure_id, bridge_id, bridge_data)
+
+
+class HomeAwayHoldUntil(FlairCoordinatorEntity, SensorEntity):
+    """Representation of default hold duration setting."""
 
+    # Only this entity's own fields; _attr_* values stay in the instance dict.
+    __slots__ = ("structure_id", "_structure", "_hold_until_raw")
 
-class VentVoltage(CoordinatorEntity, SensorEntity):
-    """Representation of Vent Voltage."""
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator, structure_id, vent_id):
+    def __init__(self, coordinator, structure_id, structure_data):
         super().__init__(coordinator)
-        self.vent_id = vent_id
         self.structure_id = structure_id
-
-
-    @property
-    def vent_data(self) -> Vent:
-        """Handle coordinator vent data."""
-
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.vent_data.id)},
-            "name": self.vent_data.attributes['name'],
+        self._structure = structure_data
+        self.entity_description = HOME_AWAY_HOLD_UNTIL_SENSOR
+        self._attr_unique_id = f"{structure_data.id}_{HOME_AWAY_HOLD_UNTIL_SENSOR.key}"
+        # Disable if system mode is set to manual on initial registration.
+        self._attr_entity_registry_enabled_default = structure_data.attributes['mode'] != 'manual'
+        # Raw hold-until string the native value was parsed from.
+        self._hold_until_raw = None
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, structure_data.id)},
+            "name": structure_data.attributes['name'],
             "manufacturer": "Flair",
-            "model": "Vent",
+            "model": "Structure",
             "configuration_url": "https://my.flair.co/",
         }
+        self._update_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.vent_data.id) + '_voltage'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Voltage"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return voltage measurement."""
-
-        return self.vent_data.attributes['voltage']
+    def _resolve_data(self) -> None:
+        """Look up this entity's structure once per coordinator update."""
 
-    @property
-    def native_unit_of_measurement(self) -> UnitOfElectricPotential:
-        """Return volts as the native unit."""
+        self._structure = self.coordinator.data.structures[self.structure_id]
 
-        return UnitOfElectricPotential.VOLT
+    def _update_state(self) -> None:
+        """Date/time when hold will end.
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
+        When home/away is set manually, holds the date/time when hold will end.
+        Only available if structure default hold duration is anything other
+        than 'until next scheduled event'
+        """
 
-        return SensorDeviceClass.VOLTAGE
+        hold_until = self._structure.attributes['hold-until']
+        self._attr_available = bool(hold_until)
+        if hold_until != self._hold_until_raw:
+            self._hold_until_raw = hold_until
+            self._attr_native_value = _fromisoformat(hold_until) if hold_until else None
 
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached structure data before writing state."""
 
-        return SensorStateClass.MEASUREMENT
+        self._resolve_data()
+        self._update_state()
+        super()._handle_coordinator_update()
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
+    def structure_data(self) -> Structure:
+        """Handle coordinator structure data."""
 
-        return EntityCategory.DIAGNOSTIC
+        return self._structure
 
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
-            return True
-        else:
-            return False
+class FlairDeviceSensor(FlairCoordinatorEntity, SensorEntity):
+    """Representation of a puck or vent reading."""
 
+    __slots__ = ("structure_id", "device_id", "device_type", "_device")
 
-class VentRSSI(CoordinatorEntity, SensorEntity):
-    """Representation of Vent RSSI."""
+    entity_description: FlairDeviceSensorEntityDescription
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator, structure_id, vent_id):
+    def __init__(
+        self,
+        coordinator: FlairDataUpdateCoordinator,
+        description: FlairDeviceSensorEntityDescription,
+        structure_id: str,
+        device_id: str,
+        device_type: str,
+        device_data: Puck | Vent,
+    ) -> None:
         super().__init__(coordinator)
-        self.vent_id = vent_id
+        self.entity_description = description
         self.structure_id = structure_id
-
-    @property
-    def vent_data(self) -> Vent:
-        """Handle coordinator vent data."""
-
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.vent_data.id)},
-            "name": self.vent_data.attributes['name'],
+        self.device_id = device_id
+        self.device_type = device_type
+        self._device = device_data
+        self._attr_unique_id = f"{device_data.id}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_data.id)},
+            "name": device_data.attributes['name'],
             "manufacturer": "Flair",
-            "model": "Vent",
+            "model": TYPE_TO_MODEL[device_type],
             "configuration_url": "https://my.flair.co/",
         }
+        self._update_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.vent_data.id) + '_rssi'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "RSSI"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> int:
-        """Return RSSI reading."""
-
-        return self.vent_data.attributes['current-rssi']
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return dBm as the native unit."""
+    def _resolve_data(self) -> None:
+        """Look up this entity's puck or vent once per coordinator update."""
 
-        return SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+        structure_data = self.coordinator.data.structures[self.structure_id]
+        if self.device_type == 'pucks':
+            self._device = structure_data.pucks[self.device_id]
+        else:
+            self._device = structure_data.vents[self.device_id]
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
+    def _update_state(self) -> None:
+        """Derive the description's value and availability for this puck or vent."""
 
-        return SensorDeviceClass.SIGNAL_STRENGTH
+        description = self.entity_description
+        self._attr_available = description.available_fn(self._device)
+        # Unavailable devices may not report the value at all.
+        self._attr_native_value = description.value_fn(self._device) if self._attr_available else None
 
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached device data before writing state."""
 
-        return SensorStateClass.MEASUREMENT
+        self._resolve_data()
+        self._update_state()
+        super()._handle_coordinator_update()
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
+    def device_data(self) -> Puck | Vent:
+        """Handle coordinator device data."""
 
-        return EntityCategory.DIAGNOSTIC
+        return self._device
 
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
 
-        if not self.vent_data.attributes['inactive']:
-            return True
-        else:
-            return False
+class HoldTempUntil(FlairCoordinatorEntity, SensorEntity):
+    """Representation of Room Temperature Hold End Time."""
 
+    __slots__ = ("structure_id", "room_id", "_structure", "_room", "_hold_until_raw")
 
-class VentReportedState(CoordinatorEntity, SensorEntity):
-    """Representation of Vent RSSI."""
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator, structure_id, vent_id):
+    def __init__(self, coordinator, structure_id, room_id, structure_data, room_data):
         super().__init__(coordinator)
-        self.vent_id = vent_id
+        self.room_id = room_id
         self.structure_id = structure_id
-
-    @property
-    def vent_data(self) -> Vent:
-        """Handle coordinator vent data."""
-
-        return self.coordinator.data.structures[self.structure_id].vents[self.vent_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.vent_data.id)},
-            "name": self.vent_data.attributes['name'],
+        self._structure = structure_data
+        self._room = room_data
+        self._hold_until_raw = None
+        self.entity_description = HOLD_UNTIL_SENSOR
+        self._attr_unique_id = f"{room_data.id}_{HOLD_UNTIL_SENSOR.key}"
+        # Disable if system mode is set to manual on initial registration.
+        self._attr_entity_registry_enabled_default = structure_data.attributes['mode'] != 'manual'
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, room_data.id)},
+            "name": room_data.attributes['name'],
             "manufacturer": "Flair",
-            "model": "Vent",
+            "model": "Room",
             "configuration_url": "https://my.flair.co/",
         }
+        self._update_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.vent_data.id) + '_reported_state'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Reported state"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> int:
-        """Return the most recent percent open reading as returned by sensors on vent."""
-
-        return self.vent_data.current_reading['percent-open']
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return % as the native unit."""
-
-        return PERCENTAGE
+    def _resolve_data(self) -> None:
+        """Look up this entity's structure and room once per coordinator update."""
 
-    @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
-
-        return EntityCategory.DIAGNOSTIC
-
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity on initial registration."""
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        self._room = self._structure.rooms[self.room_id]
 
-        return False
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-
-        if not self.vent_data.attributes['inactive']:
-            return True
-        else:
-            return False
+    def _update_state(self) -> None:
+        """Date/time when hold will end.
 
+        When room temperature is set manually, holds the date/time
+        when hold will end. Only available if structure has a default
+        hold duration other than next event.
+        """
 
-class HoldTempUntil(CoordinatorEntity, SensorEntity):
-    """Representation of Room Temperature Hold End Time."""
+        hold_until = self._room.attributes['hold-until']
+        self._attr_available = bool(hold_until)
+        if hold_until != self._hold_until_raw:
+            self._hold_until_raw = hold_until
+            self._attr_native_value = _fromisoformat(hold_until) if hold_until else None
 
-    def __init__(self, coordinator, structure_id, room_id):
-        super().__init__(coordinator)
-        self.room_id = room_id
-        self.structure_id = structure_id
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached structure and room data before writing state."""
 
+        self._resolve_data()
+        self._update_state()
+        super()._handle_coordinator_update()
 
     @property
     def room_data(self) -> Room:
         """Handle coordinator room data."""
 
-        return self.coordinator.data.structures[self.structure_id].rooms[self.room_id]
+        return self._room
 
     @property
     def structure_data(self) -> Structure:
         """Handle coordinator structure data."""
 
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.room_data.id)},
-            "name": self.room_data.attributes['name'],
-            "manufacturer": "Flair",
-            "model": "Room",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.room_data.id) + '_hold_until'
+        return self._structure
 
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Temperature holding until"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> datetime:
-        """Date/time when hold will end.
 
-        When room temperature is set manually,
-        returns date/time when hold will end.
-        """
-
-        if self.room_data.attributes['hold-until']:
-            return datetime.fromisoformat(self.room_data.attributes['hold-until'])
+class LastButtonPressed(FlairCoordinatorEntity, SensorEntity):
+    """Representation of last button pressed on HVAC unit with only button control."""
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
+    __slots__ = ("structure_id", "hvac_id", "_structure", "_hvac", "_puck")
 
-        return SensorDeviceClass.TIMESTAMP
+    _attr_has_entity_name = True
 
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Disable entity if system mode is set to manual on initial registration."""
+    def __init__(self, coordinator, structure_id, hvac_id, structure_data, hvac_data):
+        super().__init__(coordinator)
+        self.hvac_id = hvac_id
+        self.structure_id = structure_id
+        self._structure = structure_data
+        self._hvac = hvac_data
+        self._puck = structure_data.pucks[hvac_data.relationships['puck']['data']['id']]
+        self.entity_description = LAST_BUTTON_PRESSED_SENSOR
+        self._attr_unique_id = f"{hvac_data.id}_{LAST_BUTTON_PRESSED_SENSOR.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, hvac_data.id)},
+            "name": hvac_data.attributes['name'],
+            "manufacturer": hvac_data.attributes['make-name'],
+            "model": "HVAC Unit",
+            "configuration_url": "https://my.flair.co/",
+        }
+        self._update_state()
 
-        system_mode = self.structure_data.attributes['mode']
-        if system_mode == 'manual':
-            return False
-        else:
-            return True
+    def _resolve_data(self) -> None:
+        """Look up this entity's HVAC unit and puck once per coordinator update."""
 
-    @property
-    def available(self) -> bool:
-        """Determine if device is available.
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        self._hvac = self._structure.hvac_units[self.hvac_id]
+        puck_id = self._hvac.relationships['puck']['data']['id']
+        self._puck = self._structure.pucks[puck_id]
 
-        Return true if temp is set manually
-        and structure has a default hold duration
-        other than next event.
-        """
+    def _update_state(self) -> None:
+        """Derive last button pressed and availability of the associated puck."""
 
-        if self.room_data.attributes['hold-until']:
-            return True
+        last_pressed = self._hvac.attributes['button-presses']
+        if last_pressed:
+            self._attr_native_value = last_pressed[0].capitalize()
         else:
-            return False
-
+            self._attr_native_value = "No button pressed"
+        self._attr_available = not self._puck.attributes['inactive']
 
-class LastButtonPressed(CoordinatorEntity, SensorEntity):
-    """Representation of last button pressed on HVAC unit with only button control."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached HVAC unit data before writing state."""
 
-    def __init__(self, coordinator, structure_id, hvac_id):
-        super().__init__(coordinator)
-        self.hvac_id = hvac_id
-        self.structure_id = structure_id
+        self._resolve_data()
+        self._update_state()
+        super()._handle_coordinator_update()
 
     @property
     def hvac_data(self) -> HVACUnit:
         """Handle coordinator HVAC unit data."""
 
-        return self.coordinator.data.structures[self.structure_id].hvac_units[self.hvac_id]
+        return self._hvac
 
     @property
     def structure_data(self) -> Structure:
         """Handle coordinator structure data."""
 
-        return self.coordinator.data.structures[self.structure_id]
+        return self._structure
 
     @property
     def puck_data(self) -> Puck:
         """Handle coordinator puck data."""
 
-        puck_id = self.hvac_data.relationships['puck']['data']['id']
-        return self.coordinator.data.structures[self.structure_id].pucks[puck_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.hvac_data.id)},
-            "name": self.hvac_data.attributes['name'],
-            "manufacturer": self.hvac_data.attributes['make-name'],
-            "model": "HVAC Unit",
-            "configuration_url": "https://my.flair.co/",
-        }
-
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.hvac_data.id) + '_last_button_pressed'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "Last button pressed"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def icon(self) -> str:
-        """Set hvac icon."""
-
-        return 'mdi:hvac'
-
-    @property
-    def native_value(self) -> float:
-        """Return last button pressed."""
-
-        last_pressed = self.hvac_data.attributes['button-presses']
-        if last_pressed:
-            return last_pressed[0].capitalize()
-        else:
-            return "No button pressed"
+        return self._puck
 
-    @property
-    def available(self) -> bool:
-        """Return true if associated puck is available."""
 
-        if not self.puck_data.attributes['inactive']:
-            return True
-        else:
-            return False
+class BridgeRSSI(FlairCoordinatorEntity, SensorEntity):
+    """Representation of Bridge RSSI."""
 
+    __slots__ = ("structure_id", "bridge_id", "_bridge")
 
-class BridgeRSSI(CoordinatorEntity, SensorEntity):
-    """Representation of Bridge RSSI."""
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator, structure_id, bridge_id):
+    def __init__(self, coordinator, structure_id, bridge_id, bridge_data):
         super().__init__(coordinator)
         self.bridge_id = bridge_id
         self.structure_id = structure_id
-
-    @property
-    def bridge_data(self) -> Bridge:
-        """Handle coordinator bridge data."""
-
-        return self.coordinator.data.structures[self.structure_id].bridges[self.bridge_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.bridge_data.id)},
-            "name": self.bridge_data.attributes['name'],
+        self._bridge = bridge_data
+        self.entity_description = BRIDGE_RSSI_SENSOR
+        self._attr_unique_id = f"{bridge_data.id}_{BRIDGE_RSSI_SENSOR.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, bridge_data.id)},
+            "name": bridge_data.attributes['name'],
             "manufacturer": "Flair",
             "model": "Bridge",
             "configuration_url": "https://my.flair.co/",
         }
+        self._update_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.bridge_data.id) + '_rssi'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
-
-        return "RSSI"
-
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
-
-        return True
-
-    @property
-    def native_value(self) -> float:
-        """Return RSSI reading."""
-
-        return self.bridge_data.attributes['current-rssi']
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return dBm as the native unit."""
+    def _resolve_data(self) -> None:
+        """Look up this entity's bridge once per coordinator update."""
 
-        return SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+        self._bridge = self.coordinator.data.structures[self.structure_id].bridges[self.bridge_id]
 
-    @property
-    def device_class(self) -> SensorDeviceClass:
-        """Return entity device class."""
+    def _update_state(self) -> None:
+        """Derive RSSI reading and availability from the cached bridge."""
 
-        return SensorDeviceClass.SIGNAL_STRENGTH
+        attributes = self._bridge.attributes
+        self._attr_native_value = attributes['current-rssi']
+        self._attr_available = not attributes['inactive']
 
-    @property
-    def state_class(self) -> SensorStateClass:
-        """Return the type of state class."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached bridge data before writing state."""
 
-        return SensorStateClass.MEASUREMENT
+        self._resolve_data()
+        self._update_state()
+        super()._handle_coordinator_update()
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
+    def bridge_data(self) -> Bridge:
+        """Handle coordinator bridge data."""
 
-        return EntityCategory.DIAGNOSTIC
+        return self._bridge
 
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
 
-        if not self.bridge_data.attributes['inactive']:
-            return True
-        else:
-            return False
+class Gateway(FlairCoordinatorEntity, SensorEntity):
+    """Representation of device's associated gateway."""
 
+    __slots__ = ("structure_id", "device_id", "device_type", "_structure", "_device")
 
-class Gateway(CoordinatorEntity, SensorEntity):
-    """Representation of device's associated gateway."""
+    _attr_has_entity_name = True
 
-    def __init__(self, coordinator, structure_id, device_id, device_type):
+    def __init__(self, coordinator, structure_id, device_id, device_type, structure_data, device_data):
         super().__init__(coordinator)
         self.device_id = device_id
         self.device_type = device_type
         self.structure_id = structure_id
-
-    @property
-    def structure_data(self) -> Structure:
-        """Handle coordinator structure data."""
-
-        return self.coordinator.data.structures[self.structure_id]
-
-    @property
-    def device_data(self) -> Puck | Vent:
-        """Handle coordinator device data."""
-
-        if self.device_type == 'pucks':
-            return self.structure_data.pucks[self.device_id]
-        else:
-            return self.structure_data.vents[self.device_id]
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device registry information for this entity."""
-
-        return {
-            "identifiers": {(DOMAIN, self.device_data.id)},
-            "name": self.device_data.attributes['name'],
+        self._structure = structure_data
+        self._device = device_data
+        self.entity_description = GATEWAY_SENSOR
+        self._attr_unique_id = f"{device_data.id}_{GATEWAY_SENSOR.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, device_data.id)},
+            "name": device_data.attributes['name'],
             "manufacturer": "Flair",
             "model": TYPE_TO_MODEL[self.device_type],
             "configuration_url": "https://my.flair.co/",
         }
+        self._update_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Sets unique ID for this entity."""
-
-        return str(self.device_data.id) + '_gateway'
-
-    @property
-    def name(self) -> str:
-        """Return name of the entity."""
+    def _resolve_data(self) -> None:
+        """Look up this entity's device once per coordinator update."""
 
-        return "Associated gateway"
+        self._structure = self.coordinator.data.structures[self.structure_id]
+        if self.device_type == 'pucks':
+            self._device = self._structure.pucks[self.device_id]
+        else:
+            self._device = self._structure.vents[self.device_id]
 
-    @property
-    def has_entity_name(self) -> bool:
-        """Indicate that entity has name defined."""
+    def _update_state(self) -> None:
+        """Derive name of associated gateway and availability of the device."""
 
-        return True
+        self._attr_native_value = self.get_associated_gateway()
+        self._attr_available = not self._device.attributes['inactive']
 
-    @property
-    def native_value(self) -> str | None:
-        """Return name of associated gateway."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached device data before writing state."""
 
-        return self.get_associated_gateway()
+        self._resolve_data()
+        self._update_state()
+        super()._handle_coordinator_update()
 
     @property
-    def entity_category(self) -> EntityCategory:
-        """Set category to diagnostic."""
+    def structure_data(self) -> Structure:
+        """Handle coordinator structure data."""
 
-        return EntityCategory.DIAGNOSTIC
+        return self._structure
 
     @property
-    def available(self) -> bool:
-        """Return true if device is available."""
+    def device_data(self) -> Puck | Vent:
+        """Handle coordinator device data."""
 
-        if not self.device_data.attributes['inactive']:
-            return True
-        else:
-            return False
+        return self._device
 
     def get_associated_gateway(self) -> str | None:
         """Determines the gateway device is using."""
 
-        connected_gateway_id = self.device_data.attributes['connected-gateway-id']
-        connected_gateway_type = self.device_data.attributes['connected-gateway-type']
+        device_data = self.device_data
+        attributes = device_data.attributes
+        connected_gateway_id = attributes['connected-gateway-id']
+        connected_gateway_type = attributes['connected-gateway-type']
 
         if connected_gateway_id:
-            if connected_gateway_id == self.device_data.id:
+            if connected_gateway_id == device_data.id:
                 return 'Self'
             else:
                 if connected_gateway_type == 'puck':
@@ -1,6 +1,8 @@
 """Utilities for Flair Integration"""
 from __future__ import annotations
 
+from typing import Any
+
 import async_timeout
 
 from flairaio import FlairClient
@@ -28,10 +30,10 @@ async def async_validate_api(hass: HomeAssistant, client_id: str, client_secret:
             users_query = await client.get_users()
             structures_query = await client.get_structures()
     except FlairAuthError as err:
-        LOGGER.error(f'Could not authenticate on Flair servers: {err}')
+        LOGGER.error('Could not authenticate on Flair servers: %s', err)
         raise FlairAuthError(err)
     except FLAIR_ERRORS as err:
-        LOGGER.error(f'Failed to get information from Flair servers: {err}')
+        LOGGER.error('Failed to get information from Flair servers: %s', err)
         raise ConnectionError from err
 
     users: dict[str, User] = users_query.users
@@ -46,6 +48,17 @@ async def async_validate_api(hass: HomeAssistant, client_id: str, client_secret:
     return True
 
 
+def mirror_attributes(current: dict[str, Any], attributes: dict[str, Any]) -> bool:
+    """Apply written attributes to local data, return True if any value changed."""
+
+    changed = False
+    for key, value in attributes.items():
+        if current.get(key) != value:
+            current[key] = value
+            changed = True
+    return changed
+
+
 class NoUserError(Exception):
     """ No User from Flair API. """
 